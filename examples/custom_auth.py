@@ -15,7 +15,7 @@ def on_message(app, incoming):
 
 
 if __name__ == "__main__":
-    client = EasierlitClient(on_message=on_message)
+    client = EasierlitClient(on_message=on_message, worker_mode="pool")
     auth = EasierlitAuthConfig(
         username="admin",
         password="admin",
@@ -25,6 +25,9 @@ if __name__ == "__main__":
     persistence = EasierlitPersistenceConfig(
         enabled=True,
         sqlite_path=".chainlit/easierlit.db",
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        busy_timeout_ms=5000,
     )
     server = EasierlitServer(client=client, auth=auth, persistence=persistence)
     server.serve()
@@ -20,7 +20,12 @@ if __name__ == "__main__":
     client = EasierlitClient(on_message=on_message)
 
     # Option A: explicit config token (highest priority).
-    discord = EasierlitDiscordConfig(bot_token="your-discord-bot-token")
+    # pool_size/keepalive tune the shared HTTP pool used for attachment downloads.
+    discord = EasierlitDiscordConfig(
+        bot_token="your-discord-bot-token",
+        pool_size=32,
+        keepalive=75.0,
+    )
 
     # Option B: env fallback.
     # os.environ["DISCORD_BOT_TOKEN"] = "your-discord-bot-token"
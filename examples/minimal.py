@@ -12,7 +12,12 @@ def on_message(app, incoming):
 if __name__ == "__main__":
     # Minimal example: auth/persistence are enabled by default.
     # Override credentials via EASIERLIT_AUTH_USERNAME/PASSWORD or auth=...
-    client = EasierlitClient(on_message=on_message)
-    persistence = EasierlitPersistenceConfig(local_storage_dir="~/.easierlit/minimal_example")
+    client = EasierlitClient(on_message=on_message, worker_mode="pool")
+    persistence = EasierlitPersistenceConfig(
+        local_storage_dir="~/.easierlit/minimal_example",
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        busy_timeout_ms=5000,
+    )
     server = EasierlitServer(client=client, persistence=persistence)
     server.serve()
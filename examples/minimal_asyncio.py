@@ -0,0 +1,32 @@
+import asyncio
+
+from easierlit import EasierlitClient, EasierlitPersistenceConfig, EasierlitServer
+
+
+async def fetch_reply(text: str) -> str:
+    # Stand-in for an async HTTP or LLM client call that waits on the network.
+    await asyncio.sleep(1.0)
+    return f"Echo: {text}"
+
+
+async def on_message(app, incoming):
+    # Runs as a task on Easierlit's event-loop runners; while fetch_reply waits,
+    # no OS thread is held, so many slow replies can be in flight at once.
+    content = await fetch_reply(incoming.content)
+    app.add_message(
+        thread_id=incoming.thread_id,
+        content=content,
+        author="EchoBot",
+    )
+
+
+if __name__ == "__main__":
+    client = EasierlitClient(on_message=on_message, worker_mode="asyncio")
+    persistence = EasierlitPersistenceConfig(
+        local_storage_dir="~/.easierlit/minimal_example",
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        busy_timeout_ms=5000,
+    )
+    server = EasierlitServer(client=client, persistence=persistence)
+    server.serve()
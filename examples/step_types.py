@@ -1,194 +1,216 @@
 from __future__ import annotations
 
+import re
+from collections import OrderedDict
+from types import MappingProxyType
+
 from easierlit import EasierlitClient, EasierlitServer
 
 
-HELP_TEXT = (
-    "Commands:\n"
-    "- /tool <name> <output>: create a tool step\n"
-    "- /update_tool <output>: update latest tool step in this thread\n"
-    "- /thought <output>: create a reasoning step (tool name is Reasoning)\n"
-    "- /update_thought <output>: update latest reasoning step in this thread\n"
-    "- /delete_last: delete latest tool/thought steps in this thread\n"
-    "- /demo: run one full thought + tool sequence\n"
-    "- /help: show this help\n"
-)
+class _LRU(OrderedDict):
+    """Insertion-ordered map that evicts its least recently written key."""
 
-LATEST_TOOL_BY_THREAD: dict[str, tuple[str, str]] = {}
-LATEST_THOUGHT_BY_THREAD: dict[str, str] = {}
+    def __init__(self, cap: int):
+        super().__init__()
+        self.cap = cap
 
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.cap:
+            self.popitem(last=False)
 
-def on_message(app, incoming):
-    thread_id = incoming.thread_id
-    text = incoming.content.strip()
 
-    if text == "/help":
-        app.add_message(thread_id=thread_id, content=HELP_TEXT, author="StepTypes")
-        return
+# Bounded so long-running servers don't keep entries for every thread ever seen.
+LATEST_TOOL_BY_THREAD: _LRU = _LRU(cap=10_000)
+LATEST_THOUGHT_BY_THREAD: _LRU = _LRU(cap=10_000)
 
-    if text.startswith("/tool "):
-        payload = text[len("/tool ") :].strip()
-        tool_name, sep, output = payload.partition(" ")
-        if not sep:
-            app.add_message(
-                thread_id=thread_id,
-                content="Usage: /tool <name> <output>",
-                author="StepTypes",
-            )
-            return
-
-        message_id = app.add_tool(
-            thread_id=thread_id,
-            tool_name=tool_name,
-            content=output,
-            metadata={"kind": "manual-tool"},
-        )
-        LATEST_TOOL_BY_THREAD[thread_id] = (message_id, tool_name)
+
+# Module-level constants, read-only because the same object is passed on every
+# call. This is for readability only: the app still copies metadata into each
+# outgoing command, so it saves no copy.
+_TOOL_META = MappingProxyType({"kind": "manual-tool"})
+_TOOL_META_UPDATED = MappingProxyType({"kind": "manual-tool", "updated": True})
+_REASONING_META = MappingProxyType({"kind": "reasoning"})
+_REASONING_META_UPDATED = MappingProxyType({"kind": "reasoning", "updated": True})
+_PHASE_PLAN = MappingProxyType({"phase": "plan"})
+_PHASE_EXECUTE = MappingProxyType({"phase": "execute"})
+_PHASE_COMPLETE = MappingProxyType({"phase": "complete"})
+
+_USAGE_TOOL = "Usage: /tool <name> <output>"
+_USAGE_UPDATE_TOOL = "Usage: /update_tool <output>"
+_USAGE_THOUGHT = "Usage: /thought <output>"
+_USAGE_UPDATE_THOUGHT = "Usage: /update_thought <output>"
+_NO_TOOL = "No tool step to update. Create one with /tool first."
+_NO_THOUGHT = "No reasoning step to update. Create one with /thought first."
+_NOTHING_TO_DELETE = "No tool/thought steps to delete."
+_UNKNOWN_COMMAND = (
+    "Unknown command.\n"
+    "Type /help for tool/thought examples or /demo for a full sequence."
+)
+
+
+def _cmd_help(app, thread_id, arg):
+    app.add_message(thread_id=thread_id, content=HELP_TEXT, author="StepTypes")
+
+
+def _cmd_tool(app, thread_id, arg):
+    tool_name, sep, output = arg.partition(" ")
+    if not sep:
         app.add_message(
             thread_id=thread_id,
-            content=f"Created tool step `{tool_name}` with id `{message_id}`.",
+            content=_USAGE_TOOL,
             author="StepTypes",
         )
         return
 
-    if text.startswith("/update_tool "):
-        output = text[len("/update_tool ") :].strip()
-        latest = LATEST_TOOL_BY_THREAD.get(thread_id)
-        if not latest:
-            app.add_message(
-                thread_id=thread_id,
-                content="No tool step to update. Create one with /tool first.",
-                author="StepTypes",
-            )
-            return
-        if not output:
-            app.add_message(
-                thread_id=thread_id,
-                content="Usage: /update_tool <output>",
-                author="StepTypes",
-            )
-            return
-
-        message_id, tool_name = latest
-        app.update_tool(
+    message_id = app.add_tool(
+        thread_id=thread_id,
+        tool_name=tool_name,
+        content=output,
+        metadata=_TOOL_META,
+    )
+    LATEST_TOOL_BY_THREAD[thread_id] = (message_id, tool_name)
+    app.add_message(
+        thread_id=thread_id,
+        content=f"Created tool step `{tool_name}` with id `{message_id}`.",
+        author="StepTypes",
+    )
+
+
+def _cmd_update_tool(app, thread_id, arg):
+    latest = LATEST_TOOL_BY_THREAD.get(thread_id)
+    if not latest:
+        app.add_message(
             thread_id=thread_id,
-            message_id=message_id,
-            tool_name=tool_name,
-            content=output,
-            metadata={"kind": "manual-tool", "updated": True},
+            content=_NO_TOOL,
+            author="StepTypes",
         )
+        return
+    if not arg:
         app.add_message(
             thread_id=thread_id,
-            content=f"Updated tool step `{tool_name}` ({message_id}).",
+            content=_USAGE_UPDATE_TOOL,
             author="StepTypes",
         )
         return
 
-    if text.startswith("/thought "):
-        output = text[len("/thought ") :].strip()
-        if not output:
-            app.add_message(
-                thread_id=thread_id,
-                content="Usage: /thought <output>",
-                author="StepTypes",
-            )
-            return
-
-        message_id = app.add_thought(
-            thread_id=thread_id,
-            content=output,
-            metadata={"kind": "reasoning"},
-        )
-        LATEST_THOUGHT_BY_THREAD[thread_id] = message_id
+    message_id, tool_name = latest
+    app.update_tool(
+        thread_id=thread_id,
+        message_id=message_id,
+        tool_name=tool_name,
+        content=arg,
+        metadata=_TOOL_META_UPDATED,
+    )
+    app.add_message(
+        thread_id=thread_id,
+        content=f"Updated tool step `{tool_name}` ({message_id}).",
+        author="StepTypes",
+    )
+
+
+def _cmd_thought(app, thread_id, arg):
+    if not arg:
         app.add_message(
             thread_id=thread_id,
-            content=f"Created reasoning step with id `{message_id}`.",
+            content=_USAGE_THOUGHT,
             author="StepTypes",
         )
         return
 
-    if text.startswith("/update_thought "):
-        output = text[len("/update_thought ") :].strip()
-        message_id = LATEST_THOUGHT_BY_THREAD.get(thread_id)
-        if not message_id:
-            app.add_message(
-                thread_id=thread_id,
-                content="No reasoning step to update. Create one with /thought first.",
-                author="StepTypes",
-            )
-            return
-        if not output:
-            app.add_message(
-                thread_id=thread_id,
-                content="Usage: /update_thought <output>",
-                author="StepTypes",
-            )
-            return
+    message_id = app.add_thought(
+        thread_id=thread_id,
+        content=arg,
+        metadata=_REASONING_META,
+    )
+    LATEST_THOUGHT_BY_THREAD[thread_id] = message_id
+    app.add_message(
+        thread_id=thread_id,
+        content=f"Created reasoning step with id `{message_id}`.",
+        author="StepTypes",
+    )
 
-        app.update_thought(
+
+def _cmd_update_thought(app, thread_id, arg):
+    message_id = LATEST_THOUGHT_BY_THREAD.get(thread_id)
+    if not message_id:
+        app.add_message(
             thread_id=thread_id,
-            message_id=message_id,
-            content=output,
-            metadata={"kind": "reasoning", "updated": True},
+            content=_NO_THOUGHT,
+            author="StepTypes",
         )
+        return
+    if not arg:
         app.add_message(
             thread_id=thread_id,
-            content=f"Updated reasoning step ({message_id}).",
+            content=_USAGE_UPDATE_THOUGHT,
             author="StepTypes",
         )
         return
 
-    if text == "/delete_last":
-        deleted = []
+    app.update_thought(
+        thread_id=thread_id,
+        message_id=message_id,
+        content=arg,
+        metadata=_REASONING_META_UPDATED,
+    )
+    app.add_message(
+        thread_id=thread_id,
+        content=f"Updated reasoning step ({message_id}).",
+        author="StepTypes",
+    )
 
-        latest_tool = LATEST_TOOL_BY_THREAD.pop(thread_id, None)
-        if latest_tool:
-            app.delete_message(thread_id=thread_id, message_id=latest_tool[0])
-            deleted.append(f"tool:{latest_tool[0]}")
 
-        latest_thought = LATEST_THOUGHT_BY_THREAD.pop(thread_id, None)
-        if latest_thought:
-            app.delete_message(thread_id=thread_id, message_id=latest_thought)
-            deleted.append(f"thought:{latest_thought}")
+def _cmd_delete_last(app, thread_id, arg):
+    deleted = []
 
-        if not deleted:
-            content = "No tool/thought steps to delete."
-        else:
-            content = "Deleted step ids: " + ", ".join(deleted)
+    latest_tool = LATEST_TOOL_BY_THREAD.pop(thread_id, None)
+    if latest_tool:
+        app.delete_message(thread_id=thread_id, message_id=latest_tool[0])
+        deleted.append(f"tool:{latest_tool[0]}")
 
-        app.add_message(thread_id=thread_id, content=content, author="StepTypes")
-        return
+    latest_thought = LATEST_THOUGHT_BY_THREAD.pop(thread_id, None)
+    if latest_thought:
+        app.delete_message(thread_id=thread_id, message_id=latest_thought)
+        deleted.append(f"thought:{latest_thought}")
 
-    if text == "/demo":
+    if not deleted:
+        content = _NOTHING_TO_DELETE
+    else:
+        content = "Deleted step ids: " + ", ".join(deleted)
+
+    app.add_message(thread_id=thread_id, content=content, author="StepTypes")
+
+
+def _cmd_demo(app, thread_id, arg):
+    with app.batch():
         thought_id = app.add_thought(
             thread_id=thread_id,
             content="Plan: search docs -> rank snippets -> summarize.",
-            metadata={"phase": "plan"},
+            metadata=_PHASE_PLAN,
         )
         app.update_thought(
             thread_id=thread_id,
             message_id=thought_id,
             content="Plan done. Starting retrieval.",
-            metadata={"phase": "execute"},
+            metadata=_PHASE_EXECUTE,
         )
 
         tool_id = app.add_tool(
             thread_id=thread_id,
             tool_name="DocsSearch",
             content='{"query":"chainlit cot full", "top_k": 3}',
-            metadata={"phase": "execute"},
+            metadata=_PHASE_EXECUTE,
         )
         app.update_tool(
             thread_id=thread_id,
             message_id=tool_id,
             tool_name="DocsSearch",
             content='{"hits": 3, "best_match": "ui.cot=full"}',
-            metadata={"phase": "complete"},
+            metadata=_PHASE_COMPLETE,
         )
 
-        LATEST_THOUGHT_BY_THREAD[thread_id] = thought_id
-        LATEST_TOOL_BY_THREAD[thread_id] = (tool_id, "DocsSearch")
-
         app.add_message(
             thread_id=thread_id,
             content=(
@@ -199,18 +221,65 @@ def on_message(app, incoming):
             ),
             author="StepTypes",
         )
-        return
 
+    LATEST_THOUGHT_BY_THREAD[thread_id] = thought_id
+    LATEST_TOOL_BY_THREAD[thread_id] = (tool_id, "DocsSearch")
+
+
+def _cmd_unknown(app, thread_id, arg):
     app.add_message(
         thread_id=thread_id,
-        content=(
-            "Unknown command.\n"
-            "Type /help for tool/thought examples or /demo for a full sequence."
-        ),
+        content=_UNKNOWN_COMMAND,
         author="StepTypes",
     )
 
 
+COMMANDS = {
+    "/tool": _cmd_tool,
+    "/update_tool": _cmd_update_tool,
+    "/thought": _cmd_thought,
+    "/update_thought": _cmd_update_thought,
+    "/delete_last": _cmd_delete_last,
+    "/demo": _cmd_demo,
+    "/help": _cmd_help,
+}
+
+_COMMAND_HELP = {
+    "/tool": "/tool <name> <output>: create a tool step",
+    "/update_tool": "/update_tool <output>: update latest tool step in this thread",
+    "/thought": "/thought <output>: create a reasoning step (tool name is Reasoning)",
+    "/update_thought": "/update_thought <output>: update latest reasoning step in this thread",
+    "/delete_last": "/delete_last: delete latest tool/thought steps in this thread",
+    "/demo": "/demo: run one full thought + tool sequence",
+    "/help": "/help: show this help",
+}
+
+HELP_TEXT = "Commands:\n" + "".join(f"- {_COMMAND_HELP[command]}\n" for command in COMMANDS)
+
+# Commands that take an argument need "<command> <arg>"; the rest must match
+# exactly, so "/help foo" or a bare "/tool" fall through to the unknown reply.
+_ARG_COMMANDS = ("/tool", "/update_tool", "/thought", "/update_thought")
+_BARE_COMMANDS = frozenset(COMMANDS).difference(_ARG_COMMANDS)
+
+# One anchored alternation over the argument commands, matched once per message.
+_ARG_COMMAND_RE = re.compile(
+    r"(%s) (.*)\Z" % "|".join(map(re.escape, _ARG_COMMANDS)),
+    re.DOTALL,
+)
+
+
+def on_message(app, incoming):
+    text = incoming.content.strip()
+    match = _ARG_COMMAND_RE.match(text)
+    if match is not None:
+        command, arg = match.group(1, 2)
+        COMMANDS[command](app, incoming.thread_id, arg.strip())
+    elif text in _BARE_COMMANDS:
+        COMMANDS[text](app, incoming.thread_id, "")
+    else:
+        _cmd_unknown(app, incoming.thread_id, "")
+
+
 if __name__ == "__main__":
     client = EasierlitClient(on_message=on_message)
     server = EasierlitServer(client=client)
@@ -1,4 +1,5 @@
-import time
+import functools
+import re
 
 from easierlit import (
     EasierlitApp,
@@ -17,6 +18,18 @@ HELP_TEXT = (
     "- note: this example also creates one bootstrap thread inside run_func on startup"
 )
 
+# Built once at import; only the per-thread values are filled in per call.
+_format_thread_lookup = (
+    "Thread lookup result\n"
+    "- id: {id}\n"
+    "- name: {name}\n"
+    "- userId: {userId}\n"
+    "- userIdentifier: {userIdentifier}\n"
+    "- metadata: {metadata}"
+).format_map
+_THREAD_LOOKUP_KEYS = ("id", "name", "userId", "userIdentifier", "metadata")
+_ECHO_SUFFIX = "\n\nType /help for commands."
+
 
 def run_func(app: EasierlitApp):
     # Optional background worker: create one thread at startup.
@@ -32,100 +45,119 @@ def run_func(app: EasierlitApp):
         metadata={"kind": "thread-bootstrap"},
     )
 
-    while not app.is_closed():
-        time.sleep(0.2)
+    app.wait_closed()
 
 
+def _trace_errors(handler):
+    @functools.wraps(handler)
+    def wrapper(app: EasierlitApp, incoming):
+        try:
+            handler(app, incoming)
+        except Exception as exc:
+            command_name = incoming.content.strip().partition(" ")[0] or "(empty)"
+            raise RuntimeError(f"command '{command_name}' failed: {exc}") from exc
 
-def on_message(app: EasierlitApp, incoming):
-    text = incoming.content.strip()
-    command_name = text.split(maxsplit=1)[0] if text else "(empty)"
+    return wrapper
 
-    try:
-        if text == "/help":
-            app.add_message(
-                thread_id=incoming.thread_id,
-                content=HELP_TEXT,
-                author="ThreadCreator",
-            )
-            return
-
-        if text.startswith("/new"):
-            raw_name = text[len("/new") :].strip()
-            thread_name = raw_name or "Created from on_message"
-
-            thread_id = app.new_thread(
-                name=thread_name,
-                metadata={
-                    "created_by": "on_message",
-                    "source_thread_id": incoming.thread_id,
-                },
-                tags=["on-message-created"],
-            )
-            app.add_message(
-                thread_id=thread_id,
-                content=(
-                    "This thread was created from on_message.\n"
-                    f"Source thread: {incoming.thread_id}"
-                ),
-                author="ThreadCreator",
-                metadata={"kind": "thread-bootstrap"},
-            )
-
-            app.add_message(
-                thread_id=incoming.thread_id,
-                content=(
-                    f"Created new thread.\n"
-                    f"- id: {thread_id}\n"
-                    f"- name: {thread_name}\n"
-                    "- owner: auto-assigned to current login user\n"
-                    f"Use /get {thread_id} to verify."
-                ),
-                author="ThreadCreator",
-            )
-            return
-
-        if text.startswith("/get "):
-            target_id = text[len("/get ") :].strip()
-            if not target_id:
-                app.add_message(
-                    thread_id=incoming.thread_id,
-                    content="Usage: /get <thread_id>",
-                    author="ThreadCreator",
-                )
-                return
-
-            try:
-                thread = app.get_thread(target_id)
-            except ValueError:
-                app.add_message(
-                    thread_id=incoming.thread_id,
-                    content=f"Thread not found: {target_id}",
-                    author="ThreadCreator",
-                )
-                return
-
-            app.add_message(
-                thread_id=incoming.thread_id,
-                content=(
-                    f"Thread lookup result\n"
-                    f"- id: {thread.get('id')}\n"
-                    f"- name: {thread.get('name')}\n"
-                    f"- userId: {thread.get('userId')}\n"
-                    f"- userIdentifier: {thread.get('userIdentifier')}\n"
-                    f"- metadata: {thread.get('metadata')}"
-                ),
-                author="ThreadCreator",
-            )
-            return
+
+def _help(app: EasierlitApp, incoming, rest):
+    app.add_message(
+        thread_id=incoming.thread_id,
+        content=HELP_TEXT,
+        author="ThreadCreator",
+    )
+
+
+def _new(app: EasierlitApp, incoming, rest):
+    thread_name = rest.strip() or "Created from on_message"
+
+    thread_id = app.new_thread(
+        name=thread_name,
+        metadata={
+            "created_by": "on_message",
+            "source_thread_id": incoming.thread_id,
+        },
+        tags=["on-message-created"],
+    )
+    with app.batch():
+        app.add_message(
+            thread_id=thread_id,
+            content=(
+                "This thread was created from on_message.\n"
+                f"Source thread: {incoming.thread_id}"
+            ),
+            author="ThreadCreator",
+            metadata={"kind": "thread-bootstrap"},
+        )
 
         app.add_message(
             thread_id=incoming.thread_id,
-            content=f"Echo: {incoming.content}\n\nType /help for commands.",
+            content=(
+                f"Created new thread.\n"
+                f"- id: {thread_id}\n"
+                f"- name: {thread_name}\n"
+                "- owner: auto-assigned to current login user\n"
+                f"Use /get {thread_id} to verify."
+            ),
             author="ThreadCreator",
         )
-    except Exception as exc:
-        raise RuntimeError(f"command '{command_name}' failed: {exc}") from exc
+
+
+def _get(app: EasierlitApp, incoming, rest):
+    target_id = rest.strip()
+    if not target_id:
+        app.add_message(
+            thread_id=incoming.thread_id,
+            content="Usage: /get <thread_id>",
+            author="ThreadCreator",
+        )
+        return
+
+    try:
+        thread = app.get_thread(target_id)
+    except ValueError:
+        app.add_message(
+            thread_id=incoming.thread_id,
+            content=f"Thread not found: {target_id}",
+            author="ThreadCreator",
+        )
+        return
+
+    app.add_message(
+        thread_id=incoming.thread_id,
+        content=_format_thread_lookup({key: thread.get(key) for key in _THREAD_LOOKUP_KEYS}),
+        author="ThreadCreator",
+    )
+
+
+def _echo(app: EasierlitApp, incoming, rest):
+    app.add_message(
+        thread_id=incoming.thread_id,
+        content="Echo: " + incoming.content + _ECHO_SUFFIX,
+        author="ThreadCreator",
+    )
+
+
+_HANDLERS = {
+    "/help": _help,
+    "/new": _new,
+    "/get": _get,
+}
+
+
+# "/help" must match exactly, "/get" needs a space before its id, and "/new"
+# takes whatever follows it, so "/newfoo" creates a thread named "foo".
+_COMMAND_RE = re.compile(r"(/help(?=\Z)|/new|/get(?= ))(.*)", re.DOTALL)
+
+
+@_trace_errors
+def on_message(app: EasierlitApp, incoming):
+    match = _COMMAND_RE.match(incoming.content.strip())
+    if match is None:
+        _echo(app, incoming, "")
+        return
+    command, rest = match.group(1, 2)
+    _HANDLERS[command](app, incoming, rest)
 
 
 if __name__ == "__main__":
@@ -139,6 +171,9 @@ if __name__ == "__main__":
     persistence = EasierlitPersistenceConfig(
         enabled=True,
         sqlite_path=".chainlit/easierlit.db",
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        busy_timeout_ms=5000,
     )
     server = EasierlitServer(client=client, auth=auth, persistence=persistence)
     server.serve()
@@ -1,3 +1,5 @@
+import re
+
 from easierlit import (
     EasierlitAuthConfig,
     EasierlitClient,
@@ -14,82 +16,108 @@ HELP_TEXT = (
     "- anything else: echo"
 )
 
+_ECHO_SUFFIX = "\n\nType /help for CRUD commands."
 
-def on_message(app, incoming):
-    text = incoming.content.strip()
 
-    if text == "/help":
-        app.add_message(
-            thread_id=incoming.thread_id,
-            content=HELP_TEXT,
-            author="ThreadBot",
-        )
-        return
+def _help(app, incoming, rest):
+    app.add_message(
+        thread_id=incoming.thread_id,
+        content=HELP_TEXT,
+        author="ThreadBot",
+    )
 
-    if text == "/threads":
-        threads = app.list_threads(first=10, user_identifier="admin")
-        if not threads.data:
-            content = "No threads found."
-        else:
-            lines = ["Recent threads:"]
-            for item in threads.data:
-                lines.append(f"- {item['id']} | {item.get('name') or '(no name)'}")
-            content = "\n".join(lines)
 
-        app.add_message(
-            thread_id=incoming.thread_id,
-            content=content,
-            author="ThreadBot",
-        )
-        return
+def _threads(app, incoming, rest):
+    threads = app.list_threads(first=10, user_identifier="admin")
+    if not threads.data:
+        content = "No threads found."
+    else:
+        lines = ["Recent threads:"]
+        for item in threads.data:
+            lines.append(f"- {item['id']} | {item.get('name') or '(no name)'}")
+        content = "\n".join(lines)
+
+    app.add_message(
+        thread_id=incoming.thread_id,
+        content=content,
+        author="ThreadBot",
+    )
 
-    if text.startswith("/rename "):
-        new_name = text[len("/rename ") :].strip()
-        if not new_name:
-            app.add_message(
-                thread_id=incoming.thread_id,
-                content="Usage: /rename <name>",
-                author="ThreadBot",
-            )
-            return
-
-        app.update_thread(incoming.thread_id, name=new_name)
+
+def _rename(app, incoming, rest):
+    new_name = rest.strip()
+    if not new_name:
         app.add_message(
             thread_id=incoming.thread_id,
-            content=f"Renamed current thread to: {new_name}",
+            content="Usage: /rename <name>",
             author="ThreadBot",
         )
         return
 
-    if text.startswith("/delete "):
-        thread_id = text[len("/delete ") :].strip()
-        if not thread_id:
-            app.add_message(
-                thread_id=incoming.thread_id,
-                content="Usage: /delete <thread_id>",
-                author="ThreadBot",
-            )
-            return
-
-        app.delete_thread(thread_id)
+    app.update_thread(incoming.thread_id, name=new_name)
+    app.add_message(
+        thread_id=incoming.thread_id,
+        content=f"Renamed current thread to: {new_name}",
+        author="ThreadBot",
+    )
+
+
+def _delete(app, incoming, rest):
+    thread_id = rest.strip()
+    if not thread_id:
         app.add_message(
             thread_id=incoming.thread_id,
-            content=f"Deleted thread: {thread_id}",
+            content="Usage: /delete <thread_id>",
             author="ThreadBot",
         )
         return
 
+    app.delete_thread(thread_id)
+    app.add_message(
+        thread_id=incoming.thread_id,
+        content=f"Deleted thread: {thread_id}",
+        author="ThreadBot",
+    )
+
+
+def _echo(app, incoming, rest):
     app.add_message(
         thread_id=incoming.thread_id,
-        content=(
-            f"Thread: {incoming.thread_id}\n"
-            f"Message: {incoming.content}\n\n"
-            "Type /help for CRUD commands."
-        ),
+        content="Thread: " + incoming.thread_id + "\nMessage: " + incoming.content + _ECHO_SUFFIX,
         author="ThreadBot",
     )
 
 
+_HANDLERS = {
+    "/help": _help,
+    "/threads": _threads,
+    "/rename": _rename,
+    "/delete": _delete,
+}
+
+# Commands that take an argument need "<command> <arg>"; the rest must match
+# exactly, so "/help x" or a bare "/rename" are echoed like any other text.
+_ARG_COMMANDS = ("/rename", "/delete")
+_BARE_COMMANDS = frozenset(_HANDLERS).difference(_ARG_COMMANDS)
+
+_ARG_COMMAND_RE = re.compile(
+    r"(%s) (.*)\Z" % "|".join(map(re.escape, _ARG_COMMANDS)),
+    re.DOTALL,
+)
+
+
+def on_message(app, incoming):
+    text = incoming.content.strip()
+    match = _ARG_COMMAND_RE.match(text)
+    if match is not None:
+        command, rest = match.group(1, 2)
+        _HANDLERS[command](app, incoming, rest)
+    elif text in _BARE_COMMANDS:
+        _HANDLERS[text](app, incoming, "")
+    else:
+        _echo(app, incoming, "")
+
+
 if __name__ == "__main__":
     client = EasierlitClient(on_message=on_message)
     auth = EasierlitAuthConfig(
@@ -101,6 +129,9 @@ if __name__ == "__main__":
     persistence = EasierlitPersistenceConfig(
         enabled=True,
         sqlite_path=".chainlit/easierlit.db",
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        busy_timeout_ms=5000,
     )
     server = EasierlitServer(client=client, auth=auth, persistence=persistence)
     server.serve()
@@ -4,19 +4,80 @@ import inspect
 import json
 import queue
 import threading
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+try:
+    import orjson
+except ImportError:  # Optional speedup: `pip install "easierlit[fast]"`.
+    orjson = None
+
 from chainlit.data import get_data_layer
 from chainlit.types import Pagination, ThreadFilter
 from chainlit.user import User
 
 from .errors import AppClosedError, DataPersistenceNotEnabledError
-from .models import IncomingMessage, OutgoingCommand
+from .ids import new_uuid4_string
+from .models import CLOSE_COMMAND, IncomingMessage, OutgoingCommand
 from .runtime import get_runtime
 
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps_compact(value: Any) -> str:
+        return orjson.dumps(value).decode()
+
+else:
+    _json_loads = json.loads
+
+    def _json_dumps_compact(value: Any) -> str:
+        return json.dumps(value, separators=(",", ":"))
+
+
+@lru_cache(maxsize=256)
+def _dumps_tags(tags: tuple[Any, ...]) -> str:
+    # Bulk tagging tends to reapply the same few tag lists.
+    return _json_dumps_compact(list(tags))
+
+
+class MessageStream:
+    """Bound `update_message` sender for one streamed message.
+
+    Returned by `EasierlitApp.open_stream()`. Thread id, message id, and
+    metadata are resolved once; each `push()` only supplies new content.
+    """
+
+    __slots__ = ("_app", "_fields")
+
+    def __init__(self, app: EasierlitApp, fields: dict[str, Any]):
+        self._app = app
+        self._fields = fields
+
+    @property
+    def thread_id(self) -> str:
+        return self._fields["thread_id"]
+
+    @property
+    def message_id(self) -> str:
+        return self._fields["message_id"]
+
+    def push(self, content: str) -> None:
+        """Enqueue the full current content of the streamed message.
+
+        Args:
+            content: Complete message text so far (not a delta).
+
+        Raises:
+            AppClosedError: If app is already closed.
+        """
+        self._app._put_outgoing(OutgoingCommand(content=content, **self._fields))
+
+
 class EasierlitApp:
     """Primary user-facing API for message and thread operations.
 
@@ -25,6 +86,21 @@ class EasierlitApp:
     run thread CRUD operations through the configured data layer/runtime bridge.
     """
 
+    __slots__ = (
+        "_outgoing_queue",
+        "_closed",
+        "_closed_flag",
+        "_batch_state",
+        "_outgoing_notifier",
+        "_runtime",
+        "_data_layer_getter",
+        "_cached_data_layer",
+        "_sqlite_data_layer_memo",
+        "_storage_callables_memo",
+        "_owner_user_id_memo",
+        "_uuid_factory",
+    )
+
     _THOUGHT_TOOL_NAME = "Reasoning"
     _MESSAGE_STEP_TYPES = frozenset(
         {
@@ -34,6 +110,7 @@ class EasierlitApp:
             "tool",
         }
     )
+    _ELEMENT_TARGET_ID_KEYS = ("forId", "for_id", "stepId", "step_id")
 
     def __init__(
         self,
@@ -42,10 +119,21 @@ class EasierlitApp:
         data_layer_getter: Callable[[], Any | None] = get_data_layer,
         uuid_factory: Callable[[], Any] = uuid4,
     ):
-        self._outgoing_queue: queue.Queue[OutgoingCommand] = queue.Queue()
+        self._outgoing_queue: queue.SimpleQueue[OutgoingCommand] = queue.SimpleQueue()
         self._closed = threading.Event()
+        # Plain bool mirror of `_closed` for the per-command checks; the Event
+        # is kept for `wait_closed()`.
+        self._closed_flag = False
+        self._batch_state = threading.local()
+        self._outgoing_notifier: Callable[[], None] | None = None
         self._runtime = runtime if runtime is not None else get_runtime()
         self._data_layer_getter = data_layer_getter
+        self._cached_data_layer: Any | None = None
+        self._sqlite_data_layer_memo: tuple[Any, bool] | None = None
+        self._storage_callables_memo: (
+            tuple[Any, tuple[Callable[..., Any] | None, Callable[..., Any] | None]] | None
+        ) = None
+        self._owner_user_id_memo: tuple[Any, str, str] | None = None
         self._uuid_factory = uuid_factory
 
     def enqueue(
@@ -139,7 +227,7 @@ class EasierlitApp:
         thread_id: str,
         content: str,
         author: str = "Assistant",
-        metadata: dict | None = None,
+        metadata: Mapping[str, Any] | None = None,
         elements: list[Any] | None = None,
     ) -> str:
         """Enqueue an assistant-style message step.
@@ -287,7 +375,7 @@ class EasierlitApp:
         if self._runtime.is_discord_thread(resolved_thread_id):
             return True
 
-        data_layer = self._data_layer_getter()
+        data_layer = self._get_data_layer()
         if data_layer is None:
             return False
 
@@ -309,7 +397,7 @@ class EasierlitApp:
         thread_id: str,
         tool_name: str,
         content: str,
-        metadata: dict | None = None,
+        metadata: Mapping[str, Any] | None = None,
         elements: list[Any] | None = None,
     ) -> str:
         """Enqueue a tool-call step.
@@ -349,7 +437,7 @@ class EasierlitApp:
         self,
         thread_id: str,
         content: str,
-        metadata: dict | None = None,
+        metadata: Mapping[str, Any] | None = None,
         elements: list[Any] | None = None,
     ) -> str:
         """Enqueue a reasoning step (`tool_name="Reasoning"`).
@@ -376,7 +464,7 @@ class EasierlitApp:
         thread_id: str,
         message_id: str,
         content: str,
-        metadata: dict | None = None,
+        metadata: Mapping[str, Any] | None = None,
         elements: list[Any] | None = None,
     ) -> None:
         """Enqueue an update for an existing message step.
@@ -391,7 +479,7 @@ class EasierlitApp:
         Raises:
             AppClosedError: If app is already closed.
         """
-        self._enqueue_existing_step_command(
+        self._enqueue_outgoing_command(
             command="update_message",
             thread_id=thread_id,
             message_id=message_id,
@@ -400,13 +488,55 @@ class EasierlitApp:
             elements=elements,
         )
 
+    def open_stream(
+        self,
+        thread_id: str,
+        message_id: str,
+        metadata: Mapping[str, Any] | None = None,
+    ) -> MessageStream:
+        """Bind `update_message` arguments once for a token stream.
+
+        Args:
+            thread_id: Target thread id.
+            message_id: Existing step/message id, usually from `add_message`.
+            metadata: Optional metadata applied to every pushed update.
+
+        Returns:
+            `MessageStream` whose `push(content)` enqueues an update.
+
+        Raises:
+            ValueError: If `thread_id` or `message_id` is blank.
+
+        Examples:
+            ```python
+            message_id = app.add_message(thread_id, "")
+            stream = app.open_stream(thread_id, message_id)
+            text = ""
+            for token in tokens:
+                text += token
+                stream.push(text)
+            ```
+        """
+        resolved_thread_id = self._require_non_empty_thread_id(thread_id)
+        if not isinstance(message_id, str) or not message_id.strip():
+            raise ValueError("message_id must be a non-empty string.")
+
+        fields: dict[str, Any] = {
+            "command": "update_message",
+            "thread_id": resolved_thread_id,
+            "message_id": message_id,
+        }
+        if metadata:
+            fields["metadata"] = dict(metadata)
+        return MessageStream(self, fields)
+
     def update_tool(
         self,
         thread_id: str,
         message_id: str,
         tool_name: str,
         content: str,
-        metadata: dict | None = None,
+        metadata: Mapping[str, Any] | None = None,
         elements: list[Any] | None = None,
     ) -> None:
         """Enqueue an update for an existing tool-call step.
@@ -422,7 +552,7 @@ class EasierlitApp:
         Raises:
             AppClosedError: If app is already closed.
         """
-        self._enqueue_existing_step_command(
+        self._enqueue_outgoing_command(
             command="update_tool",
             thread_id=thread_id,
             message_id=message_id,
@@ -437,7 +567,7 @@ class EasierlitApp:
         thread_id: str,
         message_id: str,
         content: str,
-        metadata: dict | None = None,
+        metadata: Mapping[str, Any] | None = None,
         elements: list[Any] | None = None,
     ) -> None:
         """Update a reasoning step (`tool_name="Reasoning"`).
@@ -468,10 +598,13 @@ class EasierlitApp:
         Raises:
             AppClosedError: If app is already closed.
         """
-        self._enqueue_outgoing_command(
-            command="delete",
-            thread_id=thread_id,
-            message_id=message_id,
+        # Deletes carry no optional fields, so build the command directly.
+        self._put_outgoing(
+            OutgoingCommand(
+                command="delete",
+                thread_id=thread_id,
+                message_id=message_id,
+            )
         )
 
     def list_threads(
@@ -504,21 +637,15 @@ class EasierlitApp:
             ```
         """
         data_layer = self._get_data_layer_or_raise()
-
-        async def _list_threads():
-            user_id = None
-            if user_identifier is not None:
-                persisted_user = await data_layer.get_user(user_identifier)
-                if persisted_user is None:
-                    raise ValueError(f"User '{user_identifier}' not found.")
-                user_id = persisted_user.id
-
-            pagination = Pagination(first=first, cursor=cursor)
-            filters = ThreadFilter(search=search, userId=user_id)
-            threads = await data_layer.list_threads(pagination, filters)
-            return self._normalize_threads_tags(threads)
-
-        return self._runtime.run_coroutine_sync(_list_threads())
+        return self._runtime.run_coroutine_sync(
+            self._list_threads_async(
+                data_layer,
+                first=first,
+                cursor=cursor,
+                search=search,
+                user_identifier=user_identifier,
+            )
+        )
 
     def get_thread(self, thread_id: str) -> dict:
         """Load one thread payload from data layer.
@@ -534,14 +661,26 @@ class EasierlitApp:
             ValueError: If thread does not exist.
         """
         data_layer = self._get_data_layer_or_raise()
+        return self._runtime.run_coroutine_sync(self._get_thread_async(data_layer, thread_id))
 
-        async def _get_thread():
-            thread = await data_layer.get_thread(thread_id)
-            if thread is None:
-                raise ValueError(f"Thread '{thread_id}' not found.")
-            return self._normalize_thread_tags(thread)
+    def get_threads(self, thread_ids: list[str]) -> list[dict]:
+        """Load several thread payloads concurrently in one runtime round trip.
+
+        Args:
+            thread_ids: Target thread ids.
 
-        return self._runtime.run_coroutine_sync(_get_thread())
+        Returns:
+            Thread dictionaries in the same order as `thread_ids`.
+
+        Raises:
+            DataPersistenceNotEnabledError: If data layer is unavailable.
+            ValueError: If any thread does not exist.
+        """
+        data_layer = self._get_data_layer_or_raise()
+        get_thread_async = self._get_thread_async
+        return self._runtime.gather_sync(
+            [get_thread_async(data_layer, thread_id) for thread_id in thread_ids]
+        )
 
     def get_messages(self, thread_id: str) -> dict:
         """Return thread metadata and ordered message/tool timeline.
@@ -560,7 +699,7 @@ class EasierlitApp:
             ValueError: If thread does not exist.
         """
         thread = self.get_thread(thread_id)
-        return self._build_messages_payload(thread, data_layer=self._data_layer_getter())
+        return self._build_messages_payload(thread, data_layer=self._get_data_layer())
 
     def timeline(self, thread_id: str) -> dict:
         """Backward-compatible alias of `get_messages()`."""
@@ -627,7 +766,10 @@ class EasierlitApp:
         Raises:
             DataPersistenceNotEnabledError: If data layer is unavailable.
             ValueError: If explicit `thread_id` already exists.
-            RuntimeError: If UUID-based allocation fails after retry attempts.
+
+        Notes:
+            Generated UUID4 ids are written directly without a prior existence
+            probe; a collision is not a practical concern.
         """
         if thread_id is not None:
             self._write_thread(
@@ -641,27 +783,14 @@ class EasierlitApp:
 
         data_layer = self._get_data_layer_or_raise()
         prepared_tags = self._prepare_tags_for_update(tags, data_layer)
-
-        async def _new_thread() -> str:
-            owner_user_id = await self._resolve_default_owner_user_id(data_layer)
-            for _ in range(16):
-                thread_id = str(self._uuid_factory())
-                existing = await data_layer.get_thread(thread_id)
-                if existing is not None:
-                    continue
-
-                await data_layer.update_thread(
-                    thread_id=thread_id,
-                    name=name,
-                    user_id=owner_user_id,
-                    metadata=metadata,
-                    tags=prepared_tags,
-                )
-                return thread_id
-
-            raise RuntimeError("Failed to allocate unique thread_id.")
-
-        return self._runtime.run_coroutine_sync(_new_thread())
+        return self._runtime.run_coroutine_sync(
+            self._new_thread_async(
+                data_layer,
+                name=name,
+                metadata=metadata,
+                tags=prepared_tags,
+            )
+        )
 
     def _write_thread(
         self,
@@ -673,24 +802,16 @@ class EasierlitApp:
     ) -> None:
         data_layer = self._get_data_layer_or_raise()
         prepared_tags = self._prepare_tags_for_update(tags, data_layer)
-
-        async def _write_thread():
-            existing = await data_layer.get_thread(thread_id)
-            if require_existing and existing is None:
-                raise ValueError(f"Thread '{thread_id}' not found.")
-            if not require_existing and existing is not None:
-                raise ValueError(f"Thread '{thread_id}' already exists.")
-
-            owner_user_id = await self._resolve_default_owner_user_id(data_layer)
-            await data_layer.update_thread(
+        self._runtime.run_coroutine_sync(
+            self._write_thread_async(
+                data_layer,
                 thread_id=thread_id,
                 name=name,
-                user_id=owner_user_id,
                 metadata=metadata,
                 tags=prepared_tags,
+                require_existing=require_existing,
             )
-
-        self._runtime.run_coroutine_sync(_write_thread())
+        )
 
     def delete_thread(self, thread_id: str) -> None:
         """Delete a thread from data layer.
@@ -702,11 +823,7 @@ class EasierlitApp:
             DataPersistenceNotEnabledError: If data layer is unavailable.
         """
         data_layer = self._get_data_layer_or_raise()
-
-        async def _delete_thread():
-            await data_layer.delete_thread(thread_id)
-
-        self._runtime.run_coroutine_sync(_delete_thread())
+        self._runtime.run_coroutine_sync(data_layer.delete_thread(thread_id))
 
     def reset_thread(self, thread_id: str) -> None:
         """Reset a thread while preserving thread id and name.
@@ -726,14 +843,13 @@ class EasierlitApp:
         thread_name = thread.get("name") if isinstance(thread.get("name"), str) else None
         raw_steps = thread.get("steps")
         step_items = raw_steps if isinstance(raw_steps, list) else []
-        step_ids: list[str] = []
-        for step in step_items:
-            if not isinstance(step, dict):
-                continue
-            step_id = self._coerce_identifier(step.get("id"))
-            if step_id is None:
-                continue
-            step_ids.append(step_id)
+        coerce_identifier = self._coerce_identifier
+        step_ids = [
+            step_id
+            for step in step_items
+            if isinstance(step, dict)
+            and (step_id := coerce_identifier(step.get("id"))) is not None
+        ]
 
         self._delete_thread_steps_immediately(thread_id=thread_id, step_ids=step_ids)
         self.delete_thread(thread_id)
@@ -745,29 +861,124 @@ class EasierlitApp:
             require_existing=False,
         )
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Buffer outgoing commands from the current thread and flush them together.
+
+        Commands issued inside the block are held locally and enqueued in
+        order when the block exits, followed by a single dispatcher wakeup
+        instead of one per call. Commands from other threads may interleave
+        with the flushed run. Message ids are still returned immediately.
+        Nested `batch()` blocks join the outer one.
+
+        Raises:
+            AppClosedError: If app is closed before the buffered commands are
+                flushed.
+
+        Notes:
+            If the block raises, buffered commands are discarded and the
+            exception propagates. Each command is still persisted by the data
+            layer on its own; batching does not make them one SQL transaction.
+
+        Examples:
+            ```python
+            with app.batch():
+                tool_id = app.add_tool(thread_id, tool_name="Search", content="...")
+                app.update_tool(thread_id, tool_id, tool_name="Search", content="done")
+                app.add_message(thread_id, content="Finished.")
+            ```
+        """
+        if getattr(self._batch_state, "commands", None) is not None:
+            yield
+            return
+
+        commands: list[OutgoingCommand] = []
+        self._batch_state.commands = commands
+        try:
+            yield
+        finally:
+            self._batch_state.commands = None
+
+        if not commands:
+            return
+        if self._closed_flag:
+            raise AppClosedError("Cannot send command to a closed app.")
+        put_nowait = self._outgoing_queue.put_nowait
+        for command in commands:
+            put_nowait(command)
+        self._notify_outgoing()
+
     def close(self) -> None:
         """Mark app as closed and enqueue dispatcher close command."""
-        if self._closed.is_set():
+        if self._closed_flag:
             return
 
+        self._closed_flag = True
         self._closed.set()
-        self._outgoing_queue.put_nowait(OutgoingCommand(command="close"))
+        self._outgoing_queue.put_nowait(CLOSE_COMMAND)
+        self._notify_outgoing()
 
     def is_closed(self) -> bool:
         """Return whether the app has been closed."""
-        return self._closed.is_set()
+        return self._closed_flag
+
+    def wait_closed(self, timeout: float | None = None) -> bool:
+        """Block until the app is closed or `timeout` seconds elapse.
+
+        Args:
+            timeout: Maximum seconds to wait. `None` waits indefinitely.
+
+        Returns:
+            True if the app is closed, False if the wait timed out.
+
+        Examples:
+            ```python
+            def run_func(app):
+                while not app.wait_closed(timeout=30.0):
+                    refresh_cache()
+            ```
+        """
+        return self._closed.wait(timeout)
 
     def _pop_outgoing(self, timeout: float | None = 0.1) -> OutgoingCommand:
         if timeout is None:
             return self._outgoing_queue.get()
         return self._outgoing_queue.get(timeout=timeout)
 
+    def _pop_outgoing_batch(self, max_items: int = 64) -> list[OutgoingCommand]:
+        commands: list[OutgoingCommand] = []
+        get_nowait = self._outgoing_queue.get_nowait
+        try:
+            while len(commands) < max_items:
+                commands.append(get_nowait())
+        except queue.Empty:
+            pass
+        return commands
+
+    def _set_outgoing_notifier(self, notifier: Callable[[], None] | None) -> None:
+        self._outgoing_notifier = notifier
+
+    def _notify_outgoing(self) -> None:
+        notifier = self._outgoing_notifier
+        if notifier is not None:
+            notifier()
+
     def _put_outgoing(self, command: OutgoingCommand) -> None:
-        if self._closed.is_set():
+        if self._closed_flag:
             raise AppClosedError("Cannot send command to a closed app.")
+        commands = getattr(self._batch_state, "commands", None)
+        if commands is not None:
+            commands.append(command)
+            return
         self._outgoing_queue.put_nowait(command)
+        self._notify_outgoing()
 
     def _new_message_id(self) -> str:
+        return self._new_uuid_string()
+
+    def _new_uuid_string(self) -> str:
+        if self._uuid_factory is uuid4:
+            return new_uuid4_string()
         return str(self._uuid_factory())
 
     def _require_non_empty_thread_id(self, thread_id: str) -> str:
@@ -785,7 +996,7 @@ class EasierlitApp:
         thread_id: str,
         content: str,
         author: str = "Assistant",
-        metadata: dict | None = None,
+        metadata: Mapping[str, Any] | None = None,
         elements: list[Any] | None = None,
     ) -> str:
         message_id = self._new_message_id()
@@ -800,27 +1011,6 @@ class EasierlitApp:
         )
         return message_id
 
-    def _enqueue_existing_step_command(
-        self,
-        *,
-        command: str,
-        thread_id: str,
-        message_id: str,
-        content: str,
-        author: str = "Assistant",
-        metadata: dict | None = None,
-        elements: list[Any] | None = None,
-    ) -> None:
-        self._enqueue_outgoing_command(
-            command=command,
-            thread_id=thread_id,
-            message_id=message_id,
-            content=content,
-            author=author,
-            metadata=metadata,
-            elements=elements,
-        )
-
     def _enqueue_outgoing_command(
         self,
         *,
@@ -830,19 +1020,26 @@ class EasierlitApp:
         content: str | None = None,
         author: str = "Assistant",
         step_type: str | None = None,
-        metadata: dict | None = None,
+        metadata: Mapping[str, Any] | None = None,
         elements: list[Any] | None = None,
     ) -> None:
+        # Leave empty fields to the model defaults; pydantic validates every
+        # explicit argument, which dominates the cost of small commands.
+        optional_fields: dict[str, Any] = {}
+        if elements:
+            optional_fields["elements"] = elements
+        if step_type is not None:
+            optional_fields["step_type"] = step_type
+        if metadata:
+            optional_fields["metadata"] = metadata
         self._put_outgoing(
             OutgoingCommand(
                 command=command,
                 thread_id=thread_id,
                 message_id=message_id,
                 content=content,
-                elements=elements or [],
                 author=author,
-                step_type=step_type,
-                metadata=metadata or {},
+                **optional_fields,
             )
         )
 
@@ -850,19 +1047,34 @@ class EasierlitApp:
         if not step_ids:
             return
 
-        for step_id in step_ids:
-            self._runtime.run_coroutine_sync(
-                self._runtime.apply_outgoing_command(
+        # One cross-thread round trip for all deletes instead of one per step.
+        # The deletes still run in order: SQLite serializes writers anyway,
+        # and realtime delete events reach the UI deterministically.
+        apply_outgoing_command = self._runtime.apply_outgoing_command
+
+        async def _delete_steps_in_order() -> None:
+            for step_id in step_ids:
+                await apply_outgoing_command(
                     OutgoingCommand(
                         command="delete",
                         thread_id=thread_id,
                         message_id=step_id,
                     )
                 )
-            )
+
+        self._runtime.run_coroutine_sync(_delete_steps_in_order())
+
+    def _get_data_layer(self) -> Any | None:
+        data_layer = self._cached_data_layer
+        if data_layer is None:
+            data_layer = self._data_layer_getter()
+            # Chainlit builds the data layer once per process; keep the first
+            # non-None instance instead of re-resolving it on every call.
+            self._cached_data_layer = data_layer
+        return data_layer
 
     def _get_data_layer_or_raise(self):
-        data_layer = self._data_layer_getter()
+        data_layer = self._get_data_layer()
         if data_layer is None:
             raise DataPersistenceNotEnabledError(
                 "Data persistence is not enabled. Configure Chainlit data layer first."
@@ -870,6 +1082,14 @@ class EasierlitApp:
         return data_layer
 
     def _is_sqlite_sqlalchemy_data_layer(self, data_layer: Any) -> bool:
+        memo = self._sqlite_data_layer_memo
+        if memo is not None and memo[0] is data_layer:
+            return memo[1]
+        is_sqlite = self._detect_sqlite_sqlalchemy_data_layer(data_layer)
+        self._sqlite_data_layer_memo = (data_layer, is_sqlite)
+        return is_sqlite
+
+    def _detect_sqlite_sqlalchemy_data_layer(self, data_layer: Any) -> bool:
         conninfo = getattr(data_layer, "_conninfo", None)
         if isinstance(conninfo, str) and conninfo.lower().startswith("sqlite"):
             return True
@@ -887,17 +1107,113 @@ class EasierlitApp:
         if tags is None:
             return None
         if self._is_sqlite_sqlalchemy_data_layer(data_layer):
-            return json.dumps(tags)
+            try:
+                return _dumps_tags(tuple(tags))
+            except TypeError:
+                # Unhashable tag values cannot be cached.
+                return _json_dumps_compact(tags)
         return tags
 
+    async def _list_threads_async(
+        self,
+        data_layer: Any,
+        *,
+        first: int,
+        cursor: str | None,
+        search: str | None,
+        user_identifier: str | None,
+    ):
+        user_id = None
+        if user_identifier is not None:
+            persisted_user = await data_layer.get_user(user_identifier)
+            if persisted_user is None:
+                raise ValueError(f"User '{user_identifier}' not found.")
+            user_id = persisted_user.id
+
+        pagination = Pagination(first=first, cursor=cursor)
+        filters = ThreadFilter(search=search, userId=user_id)
+        threads = await data_layer.list_threads(pagination, filters)
+        return self._normalize_threads_tags(threads)
+
+    async def _get_thread_async(self, data_layer: Any, thread_id: str) -> dict:
+        thread = await data_layer.get_thread(thread_id)
+        if thread is None:
+            raise ValueError(f"Thread '{thread_id}' not found.")
+        return self._normalize_thread_tags(thread)
+
+    async def _new_thread_async(
+        self,
+        data_layer: Any,
+        *,
+        name: str | None,
+        metadata: dict | None,
+        tags: list[str] | str | None,
+    ) -> str:
+        owner_user_id = await self._resolve_default_owner_user_id(data_layer)
+        thread_id = self._new_uuid_string()
+        await data_layer.update_thread(
+            thread_id=thread_id,
+            name=name,
+            user_id=owner_user_id,
+            metadata=metadata,
+            tags=tags,
+        )
+        return thread_id
+
+    async def _write_thread_async(
+        self,
+        data_layer: Any,
+        *,
+        thread_id: str,
+        name: str | None,
+        metadata: dict | None,
+        tags: list[str] | str | None,
+        require_existing: bool,
+    ) -> None:
+        exists = await self._thread_exists(data_layer, thread_id)
+        if require_existing and not exists:
+            raise ValueError(f"Thread '{thread_id}' not found.")
+        if not require_existing and exists:
+            raise ValueError(f"Thread '{thread_id}' already exists.")
+
+        owner_user_id = await self._resolve_default_owner_user_id(data_layer)
+        await data_layer.update_thread(
+            thread_id=thread_id,
+            name=name,
+            user_id=owner_user_id,
+            metadata=metadata,
+            tags=tags,
+        )
+
+    async def _thread_exists(self, data_layer: Any, thread_id: str) -> bool:
+        # `get_thread` loads every step, element, and feedback row; SQL data
+        # layers can answer the existence check with a single-row probe.
+        execute_sql = getattr(data_layer, "execute_sql", None)
+        if callable(execute_sql):
+            rows = await execute_sql(
+                query='SELECT "id" FROM threads WHERE "id" = :id LIMIT 1',
+                parameters={"id": thread_id},
+            )
+            if isinstance(rows, list):
+                return bool(rows)
+
+        return await data_layer.get_thread(thread_id) is not None
+
     async def _resolve_default_owner_user_id(self, data_layer: Any) -> str | None:
         auth = self._runtime.get_auth()
         if auth is None:
             return None
 
         identifier = auth.identifier or auth.username
+        # Keyed on data layer and identifier, so a rebound auth config or data
+        # layer resolves again instead of reusing a stale id.
+        memo = self._owner_user_id_memo
+        if memo is not None and memo[0] is data_layer and memo[1] == identifier:
+            return memo[2]
+
         persisted_user = await data_layer.get_user(identifier)
         if persisted_user is not None:
+            self._owner_user_id_memo = (data_layer, identifier, persisted_user.id)
             return persisted_user.id
 
         if not hasattr(data_layer, "create_user"):
@@ -912,6 +1228,7 @@ class EasierlitApp:
         if created_user is None:
             return None
 
+        self._owner_user_id_memo = (data_layer, identifier, created_user.id)
         return created_user.id
 
     def _normalize_thread_tags(self, thread: dict) -> dict:
@@ -920,51 +1237,63 @@ class EasierlitApp:
             return thread
 
         try:
-            decoded = json.loads(tags)
-        except json.JSONDecodeError:
+            decoded = _json_loads(tags)
+        except ValueError:
             return thread
 
         if not isinstance(decoded, list):
             return thread
 
-        normalized = dict(thread)
-        normalized["tags"] = decoded
-        return normalized
+        # The data layer hands back freshly built dicts, so decode in place
+        # instead of copying every thread on the page.
+        thread["tags"] = decoded
+        return thread
 
     def _normalize_threads_tags(self, threads):
-        if not hasattr(threads, "data"):
+        data = getattr(threads, "data", None)
+        if not isinstance(data, list):
             return threads
 
-        threads.data = [
-            self._normalize_thread_tags(thread)
-            if isinstance(thread, dict)
-            else thread
-            for thread in threads.data
-        ]
+        normalize_thread_tags = self._normalize_thread_tags
+        for thread in data:
+            if isinstance(thread, dict):
+                normalize_thread_tags(thread)
         return threads
 
     def _build_messages_payload(self, thread: dict, *, data_layer: Any | None = None) -> dict:
-        raw_steps = thread.get("steps")
-        step_items = raw_steps if isinstance(raw_steps, list) else []
-        messages = self._filter_message_steps(step_items)
-
         raw_elements = thread.get("elements")
         element_items = raw_elements if isinstance(raw_elements, list) else []
         elements_by_for_id = self._index_elements_by_for_id(element_items)
 
+        raw_steps = thread.get("steps")
+        step_items = raw_steps if isinstance(raw_steps, list) else []
+        allowed_types = self._MESSAGE_STEP_TYPES
+        coerce_identifier = self._coerce_identifier
+        normalize_element = self._normalize_message_element
+        related_elements_for = elements_by_for_id.get
+
+        # Filter message steps and attach their elements in a single pass.
         enriched_messages: list[dict] = []
-        for message in messages:
-            message_copy = dict(message)
-            message_id = self._coerce_identifier(message_copy.get("id"))
-            if message_id is not None:
-                related_elements = elements_by_for_id.get(message_id, [])
-                message_copy["elements"] = [
-                    self._normalize_message_element(element, data_layer=data_layer)
-                    for element in related_elements
-                ]
-            else:
-                message_copy["elements"] = []
-            enriched_messages.append(message_copy)
+        for step in step_items:
+            if not isinstance(step, dict):
+                continue
+            step_type = step.get("type")
+            if not isinstance(step_type, str) or step_type not in allowed_types:
+                continue
+
+            message_id = coerce_identifier(step.get("id"))
+            related_elements = (
+                related_elements_for(message_id, ()) if message_id is not None else ()
+            )
+            enriched_messages.append(
+                {
+                    **step,
+                    "elements": [
+                        normalize_element(element, data_layer=data_layer)
+                        for element in related_elements
+                    ],
+                }
+            )
 
         thread_metadata = dict(thread)
         thread_metadata.pop("steps", None)
@@ -974,32 +1303,30 @@ class EasierlitApp:
             "messages": enriched_messages,
         }
 
-    def _filter_message_steps(self, steps: list[dict]) -> list[dict]:
-        filtered_steps: list[dict] = []
-        for step in steps:
-            if not isinstance(step, dict):
-                continue
-            step_type = step.get("type")
-            if not isinstance(step_type, str):
-                continue
-            if step_type in self._MESSAGE_STEP_TYPES:
-                filtered_steps.append(step)
-        return filtered_steps
-
     def _index_elements_by_for_id(self, elements: list[dict]) -> dict[str, list[dict]]:
-        elements_by_for_id: dict[str, list[dict]] = {}
+        elements_by_for_id: defaultdict[str, list[dict]] = defaultdict(list)
+        extract_target_id = self._extract_element_target_id
         for element in elements:
             if not isinstance(element, dict):
                 continue
-            for_id = self._extract_element_target_id(element)
+            for_id = extract_target_id(element)
             if for_id is None:
                 continue
-            elements_by_for_id.setdefault(for_id, []).append(element)
+            elements_by_for_id[for_id].append(element)
         return elements_by_for_id
 
     def _extract_element_target_id(self, element: dict) -> str | None:
-        for key in ("forId", "for_id", "stepId", "step_id"):
-            identifier = self._coerce_identifier(element.get(key))
+        get = element.get
+        for key in self._ELEMENT_TARGET_ID_KEYS:
+            value = get(key)
+            if value is None:
+                continue
+            # Ids are almost always strings; only other types need coercion.
+            if isinstance(value, str):
+                if value:
+                    return value
+                continue
+            identifier = self._coerce_identifier(value)
             if identifier is not None:
                 return identifier
         return None
@@ -1070,17 +1397,14 @@ class EasierlitApp:
         object_key: str,
         data_layer: Any | None = None,
     ) -> str | None:
-        storage = self._resolve_storage_provider(data_layer)
-        if storage is None:
-            return None
-
-        get_read_url = getattr(storage, "get_read_url", None)
-        if not callable(get_read_url):
+        get_read_url, _ = self._resolve_storage_callables(data_layer)
+        if get_read_url is None:
             return None
 
         try:
             maybe_url = get_read_url(object_key)
-            if inspect.isawaitable(maybe_url):
+            # Sync providers return plain strings; skip the Awaitable ABC probe.
+            if not isinstance(maybe_url, str) and inspect.isawaitable(maybe_url):
                 maybe_url = self._runtime.run_coroutine_sync(maybe_url)
         except Exception:
             return None
@@ -1095,12 +1419,8 @@ class EasierlitApp:
         object_key: str,
         data_layer: Any | None = None,
     ) -> str | None:
-        storage = self._resolve_storage_provider(data_layer)
-        if storage is None:
-            return None
-
-        resolve_file_path = getattr(storage, "resolve_file_path", None)
-        if not callable(resolve_file_path):
+        _, resolve_file_path = self._resolve_storage_callables(data_layer)
+        if resolve_file_path is None:
             return None
 
         try:
@@ -1116,6 +1436,27 @@ class EasierlitApp:
             return None
         return str(path)
 
+    def _resolve_storage_callables(
+        self,
+        data_layer: Any | None,
+    ) -> tuple[Callable[..., Any] | None, Callable[..., Any] | None]:
+        if data_layer is None:
+            return None, None
+        memo = self._storage_callables_memo
+        if memo is not None and memo[0] is data_layer:
+            return memo[1]
+
+        # Resolved once per data layer instead of once per element.
+        storage = self._resolve_storage_provider(data_layer)
+        get_read_url = getattr(storage, "get_read_url", None)
+        resolve_file_path = getattr(storage, "resolve_file_path", None)
+        callables = (
+            get_read_url if callable(get_read_url) else None,
+            resolve_file_path if callable(resolve_file_path) else None,
+        )
+        self._storage_callables_memo = (data_layer, callables)
+        return callables
+
     def _resolve_storage_provider(self, data_layer: Any | None):
         if data_layer is None:
             return None
@@ -1131,18 +1472,19 @@ class EasierlitApp:
             return value
         return None
 
-    def _coerce_identifier(self, value: Any) -> str | None:
-        if isinstance(value, str):
-            return value if value else None
+    @staticmethod
+    def _coerce_identifier(value: Any) -> str | None:
+        # Exact str is the dominant case for step and element ids.
+        if type(value) is str:
+            return value or None
         if value is None:
             return None
+        if isinstance(value, str):
+            return value or None
         if isinstance(value, (dict, list, tuple, set, bytes, bytearray)):
             return None
 
-        rendered = str(value)
-        if not rendered:
-            return None
-        return rendered
+        return str(value) or None
 
     def _decode_thread_metadata(self, value: Any) -> dict[str, Any]:
         if isinstance(value, dict):
@@ -4,8 +4,9 @@ import asyncio
 import logging
 import os
 import secrets
+import stat
 import sys
-from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import chainlit as cl
 from chainlit.auth import require_login
@@ -18,12 +19,10 @@ from fastapi.responses import FileResponse
 
 # When this module is loaded by Chainlit's load_module(file_path), ensure the
 # src root is importable so absolute imports keep working.
-_THIS_FILE = Path(__file__).resolve()
-_SRC_ROOT = _THIS_FILE.parents[1]
-if str(_SRC_ROOT) not in sys.path:
-    sys.path.insert(0, str(_SRC_ROOT))
+_SRC_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+if _SRC_ROOT not in sys.path:
+    sys.path.insert(0, _SRC_ROOT)
 
-from easierlit.discord_bridge import EasierlitDiscordBridge
 from easierlit.errors import AppClosedError, RunFuncExecutionError
 from easierlit.models import IncomingMessage
 from easierlit.runtime import get_runtime
@@ -33,7 +32,14 @@ from easierlit.settings import (
     _resolve_local_storage_provider,
 )
 from easierlit.storage.local import LOCAL_STORAGE_ROUTE_PREFIX, LocalFileStorageClient
-from easierlit.sqlite_bootstrap import ensure_sqlite_schema
+from easierlit.sqlite_bootstrap import (
+    build_sqlite_pragmas,
+    ensure_sqlite_schema,
+    install_sqlite_pragmas,
+)
+
+if TYPE_CHECKING:
+    from easierlit.discord_bridge import EasierlitDiscordBridge
 
 LOGGER = logging.getLogger(__name__)
 RUNTIME = get_runtime()
@@ -47,12 +53,16 @@ _LOCAL_STORAGE_PROVIDER: LocalFileStorageClient | None = None
 _CHAINLIT_DISCORD_CLIENT = None
 _CHAINLIT_DISCORD_START_ORIGINAL = None
 _CHAINLIT_DISCORD_AUTOSTART_SUPPRESSED = False
+# SQLAlchemy's QueuePool default, kept on top of the configured pool_size.
+_SQLITE_POOL_MAX_OVERFLOW = 10
 
 
 def _summarize_worker_error(traceback_text: str) -> str:
-    lines = [line.strip() for line in traceback_text.strip().splitlines() if line.strip()]
-    if lines:
-        return lines[-1]
+    # The summary is the last non-blank line; scan from the end.
+    for line in reversed(traceback_text.splitlines()):
+        stripped = line.strip()
+        if stripped:
+            return stripped
     return "Unknown run_func error"
 
 
@@ -68,6 +78,10 @@ def _suppress_chainlit_discord_autostart() -> None:
 
     if _CHAINLIT_DISCORD_AUTOSTART_SUPPRESSED:
         return
+    # Chainlit only autostarts its Discord client when this is set; without it
+    # there is nothing to suppress and discord.py need not be imported.
+    if not os.environ.get("DISCORD_BOT_TOKEN"):
+        return
 
     try:
         chainlit_discord_client = _resolve_chainlit_discord_client()
@@ -108,9 +122,9 @@ def _restore_chainlit_discord_autostart() -> None:
     _CHAINLIT_DISCORD_AUTOSTART_SUPPRESSED = False
 
 
-def _register_discord_channel_for_current_session() -> None:
-    session = cl.context.session
+def _register_current_session(session: Any) -> None:
     if getattr(session, "client_type", None) != "discord":
+        RUNTIME.register_session(thread_id=session.thread_id, session_id=session.id)
         return
 
     try:
@@ -133,13 +147,6 @@ def _register_discord_channel_for_current_session() -> None:
     )
 
 
-def _register_non_discord_session_for_current_session() -> None:
-    session = cl.context.session
-    if getattr(session, "client_type", None) == "discord":
-        return
-    RUNTIME.register_session(thread_id=session.thread_id, session_id=session.id)
-
-
 def _apply_runtime_configuration() -> None:
     global _CONFIG_APPLIED
     if _CONFIG_APPLIED:
@@ -166,38 +173,63 @@ def _ensure_local_storage_provider_initialized() -> LocalFileStorageClient:
     return _LOCAL_STORAGE_PROVIDER
 
 
-def _register_local_storage_route_if_needed() -> None:
-    global _LOCAL_STORAGE_ROUTE_REGISTERED
-    if _LOCAL_STORAGE_ROUTE_REGISTERED:
-        return
+_LOCAL_STORAGE_ROUTE_PATH = f"{LOCAL_STORAGE_ROUTE_PREFIX}/{{object_key:path}}"
 
-    route_path = f"{LOCAL_STORAGE_ROUTE_PREFIX}" + "/{object_key:path}"
 
-    @chainlit_app.get(route_path)
-    async def _easierlit_local_storage_file(object_key: str):
-        storage_provider = __resolve_local_storage_provider_for_read()
+async def _easierlit_local_storage_file(object_key: str):
+    storage_provider = __resolve_local_storage_provider_for_read()
 
-        try:
-            file_path = storage_provider.resolve_file_path(object_key)
-        except (TypeError, ValueError) as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    try:
+        file_path = storage_provider.resolve_file_path(object_key)
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-        if not file_path.is_file():
-            LOGGER.warning(
-                "Local storage file not found: object_key=%s resolved_path=%s base_dir=%s",
-                object_key,
-                file_path,
-                storage_provider.base_dir,
-            )
-            raise HTTPException(status_code=404, detail="File not found.")
+    # One stat per request: reuse it for the regular-file check and hand
+    # it to FileResponse so Starlette does not stat the file again.
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        stat_result = None
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+        LOGGER.warning(
+            "Local storage file not found: object_key=%s resolved_path=%s base_dir=%s",
+            object_key,
+            file_path,
+            storage_provider.base_dir,
+        )
+        raise HTTPException(status_code=404, detail="File not found.")
 
-        return FileResponse(path=str(file_path))
+    return FileResponse(path=str(file_path), stat_result=stat_result)
 
-    _promote_local_storage_route_before_spa_fallback(route_path)
+
+def _register_local_storage_route_if_needed() -> None:
+    global _LOCAL_STORAGE_ROUTE_REGISTERED
+    if _LOCAL_STORAGE_ROUTE_REGISTERED:
+        return
+
+    # A reload can re-import this module (resetting the flag) while
+    # chainlit_app persists, so also dedupe against the router itself.
+    already_registered = any(
+        getattr(route, "path", None) == _LOCAL_STORAGE_ROUTE_PATH
+        for route in chainlit_app.router.routes
+    )
+    if not already_registered:
+        # Internal file route: keep it out of the OpenAPI schema.
+        chainlit_app.add_api_route(
+            _LOCAL_STORAGE_ROUTE_PATH,
+            _easierlit_local_storage_file,
+            methods=["GET"],
+            include_in_schema=False,
+        )
+    _promote_local_storage_route_before_spa_fallback(_LOCAL_STORAGE_ROUTE_PATH)
     _LOCAL_STORAGE_ROUTE_REGISTERED = True
 
 
 def __resolve_local_storage_provider_for_read():
+    # Set during startup and cleared on shutdown; skip re-resolving per request.
+    storage_provider = _LOCAL_STORAGE_PROVIDER
+    if storage_provider is not None:
+        return storage_provider
     try:
         return _ensure_local_storage_provider_initialized()
     except (TypeError, ValueError) as exc:
@@ -234,15 +266,20 @@ def _apply_auth_configuration() -> None:
     if auth is None:
         return
 
-    expected_username = auth.username
-    expected_password = auth.password
+    # Compare bytes: encoded once here, and compare_digest rejects non-ASCII str.
+    expected_username = auth.username.encode("utf-8", "surrogatepass")
+    expected_password = auth.password.encode("utf-8", "surrogatepass")
     resolved_identifier = auth.identifier or auth.username
     resolved_metadata = auth.metadata or {}
 
     async def _password_auth_callback(username: str, password: str) -> User | None:
-        if not secrets.compare_digest(username, expected_username):
+        if not secrets.compare_digest(
+            username.encode("utf-8", "surrogatepass"), expected_username
+        ):
             return None
-        if not secrets.compare_digest(password, expected_password):
+        if not secrets.compare_digest(
+            password.encode("utf-8", "surrogatepass"), expected_password
+        ):
             return None
         return User(identifier=resolved_identifier, metadata=dict(resolved_metadata))
 
@@ -272,12 +309,40 @@ def _register_default_data_layer_if_needed() -> None:
     db_path = ensure_sqlite_schema(persistence.sqlite_path).resolve()
     conninfo = f"sqlite+aiosqlite:///{db_path}"
     storage_provider = _ensure_local_storage_provider_initialized()
+    sqlite_pragmas = build_sqlite_pragmas(
+        journal_mode=persistence.journal_mode,
+        synchronous=persistence.synchronous,
+        busy_timeout_ms=persistence.busy_timeout_ms,
+    )
+    pool_size = persistence.pool_size
 
     @cl.data_layer
     def _easierlit_default_data_layer():
         from chainlit.data.sql_alchemy import SQLAlchemyDataLayer
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+        from sqlalchemy.orm import sessionmaker
 
         class _EasierlitLocalSQLAlchemyDataLayer(SQLAlchemyDataLayer):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                # Chainlit's engine keeps 5 idle connections (plus 10 overflow).
+                # Replace it before first use so `pool_size` connections stay
+                # open for WAL readers, keeping the overflow for bursts.
+                replaced_engine = self.engine
+                self.engine = create_async_engine(
+                    conninfo,
+                    pool_size=pool_size,
+                    max_overflow=_SQLITE_POOL_MAX_OVERFLOW,
+                )
+                # Never connected, so a sync dispose only releases the pool.
+                replaced_engine.sync_engine.dispose()
+                self.async_session = sessionmaker(
+                    bind=self.engine,
+                    expire_on_commit=False,
+                    class_=AsyncSession,
+                )
+                install_sqlite_pragmas(self.engine, sqlite_pragmas)
+
             async def get_element(self, thread_id: str, element_id: str):
                 element = await super().get_element(thread_id, element_id)
                 if not isinstance(element, dict):
@@ -332,7 +397,20 @@ async def _start_discord_bridge_if_needed() -> None:
         return
 
     if _DISCORD_BRIDGE is None:
-        _DISCORD_BRIDGE = EasierlitDiscordBridge(runtime=RUNTIME, bot_token=discord_token)
+        from easierlit.discord_bridge import EasierlitDiscordBridge
+
+        discord = RUNTIME.get_discord()
+        bridge_kwargs = {}
+        if discord is not None:
+            bridge_kwargs = {
+                "http_pool_size": discord.pool_size,
+                "http_keepalive": discord.keepalive,
+            }
+        _DISCORD_BRIDGE = EasierlitDiscordBridge(
+            runtime=RUNTIME,
+            bot_token=discord_token,
+            **bridge_kwargs,
+        )
 
     try:
         await _DISCORD_BRIDGE.start()
@@ -418,20 +496,20 @@ async def _on_app_shutdown() -> None:
         _LOCAL_STORAGE_PROVIDER = None
 
 
+# Stays async: Chainlit wraps on_chat_start in a step, and the sync step path
+# sends that step from a detached task instead of awaiting it.
 @cl.on_chat_start
 async def _on_chat_start() -> None:
-    _register_non_discord_session_for_current_session()
-    _register_discord_channel_for_current_session()
+    _register_current_session(cl.context.session)
 
 
 @cl.on_chat_resume
-async def _on_chat_resume(_thread: dict) -> None:
-    _register_non_discord_session_for_current_session()
-    _register_discord_channel_for_current_session()
+def _on_chat_resume(_thread: dict) -> None:
+    _register_current_session(cl.context.session)
 
 
 @cl.on_chat_end
-async def _on_chat_end() -> None:
+def _on_chat_end() -> None:
     session = cl.context.session
     RUNTIME.unregister_session(session.id)
 
@@ -441,8 +519,7 @@ async def _on_message(message: cl.Message) -> None:
     global _APP_CLOSED_WARNING_EMITTED, _WORKER_FAILURE_UI_NOTIFIED
 
     session = cl.context.session
-    _register_non_discord_session_for_current_session()
-    _register_discord_channel_for_current_session()
+    _register_current_session(session)
 
     incoming = IncomingMessage(
         thread_id=session.thread_id,
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import contextvars
 import inspect
 import logging
 import queue
@@ -14,9 +16,12 @@ from .errors import AppClosedError, RunFuncExecutionError, WorkerAlreadyRunningE
 from .models import IncomingMessage
 
 RunFuncMode = Literal["auto", "sync", "async"]
+WorkerMode = Literal["thread", "pool", "asyncio"]
 
 LOGGER = logging.getLogger(__name__)
 
+_POOL_STOP = object()
+
 
 class AsyncAwaitableRunner:
     def __init__(self) -> None:
@@ -62,6 +67,9 @@ class AsyncAwaitableRunner:
             return loop is not None and loop.is_running()
 
     def run_awaitable(self, awaitable: Any) -> Any:
+        return self.submit(awaitable).result()
+
+    def submit(self, awaitable: Any) -> concurrent.futures.Future[Any]:
         with self._lock:
             loop = self._loop
 
@@ -77,8 +85,15 @@ class AsyncAwaitableRunner:
 
             coroutine = _await_result()
 
-        future = asyncio.run_coroutine_threadsafe(coroutine, loop)
-        return future.result()
+        return asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+    def call_soon(self, callback: Callable[..., Any], *args: Any) -> None:
+        with self._lock:
+            loop = self._loop
+
+        if loop is None or loop.is_closed():
+            raise RuntimeError("Async awaitable runner loop is not running.")
+        loop.call_soon_threadsafe(callback, *args)
 
     def _thread_entry(self) -> None:
         loop = asyncio.new_event_loop()
@@ -120,12 +135,16 @@ def _close_unawaited_awaitable(value: Any) -> None:
 
 
 def _run_awaitable(awaitable: Any, awaitable_runner: AsyncAwaitableRunner) -> None:
-    if awaitable_runner.is_running():
-        try:
-            awaitable_runner.run_awaitable(awaitable)
-            return
-        except RuntimeError:
-            pass
+    try:
+        future = awaitable_runner.submit(awaitable)
+    except RuntimeError:
+        # Runner loop is not running (e.g. after stop()); run on a throwaway loop.
+        future = None
+    if future is not None:
+        # Errors raised by the awaitable itself propagate; they must not fall
+        # through to asyncio.run() with an already-consumed coroutine.
+        future.result()
+        return
 
     if inspect.iscoroutine(awaitable):
         asyncio.run(awaitable)
@@ -167,6 +186,27 @@ def _execute_run_func(
         _run_awaitable(result, awaitable_runner)
 
 
+async def _execute_on_message_async(
+    on_message: Callable[[EasierlitApp, IncomingMessage], Any],
+    app: EasierlitApp,
+    incoming: IncomingMessage,
+    executor: concurrent.futures.Executor | None = None,
+) -> None:
+    if inspect.iscoroutinefunction(on_message):
+        await on_message(app, incoming)
+        return
+
+    if executor is None:
+        result = await asyncio.to_thread(on_message, app, incoming)
+    else:
+        # Same context propagation as to_thread, on the shared executor.
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        result = await loop.run_in_executor(executor, context.run, on_message, app, incoming)
+    if inspect.isawaitable(result):
+        await result
+
+
 def _execute_on_message(
     on_message: Callable[[EasierlitApp, IncomingMessage], Any],
     app: EasierlitApp,
@@ -190,7 +230,7 @@ class EasierlitClient:
         self,
         on_message: Callable[[EasierlitApp, IncomingMessage], Any],
         run_funcs: list[Callable[[EasierlitApp], Any]] | None = None,
-        worker_mode: Literal["thread"] = "thread",
+        worker_mode: WorkerMode = "thread",
         run_func_mode: RunFuncMode = "auto",
         max_message_workers: int = 64,
     ):
@@ -201,14 +241,21 @@ class EasierlitClient:
                 `on_message(app, incoming)`. Sync and async are both supported.
             run_funcs: Optional background worker functions called as
                 `run_func(app)`.
-            worker_mode: Worker backend mode. Currently only `"thread"` is
-                supported.
+            worker_mode: Worker backend mode for `on_message`.
+                - `"thread"`: start one short-lived thread per message.
+                - `"pool"`: keep up to `max_message_workers` persistent
+                  threads, started on demand, that consume scheduled messages
+                  from one shared queue.
+                - `"asyncio"`: run each message as a task on the internal
+                  event-loop runners. Coroutine handlers run on the loop
+                  directly; sync handlers run on the client's shared
+                  executor of `max_message_workers` threads.
             run_func_mode: Execution mode for `run_funcs`.
                 - `"auto"`: auto-detect awaitable return.
                 - `"sync"`: require non-awaitable return.
                 - `"async"`: require awaitable return.
             max_message_workers: Max concurrent `on_message` workers across all
-                active thread ids.
+                active thread ids. In `"pool"` mode this is the pool size.
 
         Raises:
             TypeError: If `on_message` is not callable.
@@ -235,8 +282,8 @@ class EasierlitClient:
         """
         if not callable(on_message):
             raise TypeError("on_message must be callable.")
-        if worker_mode != "thread":
-            raise ValueError("worker_mode must be 'thread'.")
+        if worker_mode not in ("thread", "pool", "asyncio"):
+            raise ValueError("worker_mode must be 'thread', 'pool', or 'asyncio'.")
         if run_func_mode not in ("auto", "sync", "async"):
             raise ValueError("run_func_mode must be one of 'auto', 'sync', or 'async'.")
         if run_funcs is None:
@@ -269,7 +316,10 @@ class EasierlitClient:
         self._active_chat_threads: set[str] = set()
         self._active_message_worker_count = 0
         self._inflight_message_workers: set[threading.Thread] = set()
+        self._message_pool_threads: list[threading.Thread] = []
+        self._message_pool_queue: queue.SimpleQueue[Any] | None = None
         self._accept_incoming_messages = False
+        self._message_executor: concurrent.futures.ThreadPoolExecutor | None = None
         self._run_func_awaitable_runner = AsyncAwaitableRunner()
         message_runner_count = min(self.max_message_workers, 8)
         self._message_awaitable_runners = [
@@ -295,6 +345,15 @@ class EasierlitClient:
         self._reset_worker_error_state()
         self._start_awaitable_runners()
         self._app = app
+        if self.worker_mode == "pool":
+            self._start_message_pool(app)
+        elif self.worker_mode == "asyncio":
+            # One pool shared by every runner loop for sync on_message handlers,
+            # instead of a lazily created default executor per loop.
+            self._message_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_message_workers,
+                thread_name_prefix="easierlit-on-message",
+            )
 
         with self._message_scheduler_lock:
             self._pending_messages_by_thread.clear()
@@ -309,8 +368,10 @@ class EasierlitClient:
         """Stop scheduling new incoming messages and shutdown workers.
 
         This method closes the app, clears pending incoming buffers, joins
-        background `run_funcs` threads, and shuts down awaitable runners. It
-        does not wait for every in-flight message worker to complete.
+        background `run_funcs` threads, and shuts down awaitable runners. In
+        `"pool"` mode it also joins the pool workers, so in-flight messages
+        get up to `timeout` to finish; other modes do not wait for in-flight
+        message workers.
 
         Args:
             timeout: Join timeout (seconds) applied per worker thread.
@@ -327,6 +388,8 @@ class EasierlitClient:
         if app is not None:
             app.close()
 
+        self._stop_message_pool(timeout=timeout)
+
         if self._threads:
             for thread in self._threads:
                 thread.join(timeout=timeout)
@@ -334,6 +397,10 @@ class EasierlitClient:
 
         self._app = None
         self._stop_awaitable_runners(timeout=timeout)
+        message_executor = self._message_executor
+        if message_executor is not None:
+            self._message_executor = None
+            message_executor.shutdown(wait=False)
         self._raise_worker_error_if_any()
 
     def dispatch_incoming(self, incoming: IncomingMessage) -> None:
@@ -385,6 +452,53 @@ class EasierlitClient:
                 app=app,
             )
 
+    def _start_message_pool(self, app: EasierlitApp) -> None:
+        # Workers are started lazily by the scheduler, up to max_message_workers,
+        # so an idle client does not hold the full pool of threads.
+        with self._message_scheduler_lock:
+            self._message_pool_threads = []
+            self._message_pool_queue = queue.SimpleQueue()
+
+    def _ensure_message_pool_worker_locked(self, app: EasierlitApp) -> None:
+        message_queue = self._message_pool_queue
+        if message_queue is None:
+            return
+        if len(self._message_pool_threads) >= self._active_message_worker_count:
+            return
+        worker = threading.Thread(
+            target=self._message_pool_worker_entry,
+            args=(app, message_queue),
+            name="easierlit-message-pool",
+            daemon=True,
+        )
+        self._message_pool_threads.append(worker)
+        worker.start()
+
+    def _stop_message_pool(self, *, timeout: float) -> None:
+        with self._message_scheduler_lock:
+            message_queue = self._message_pool_queue
+            self._message_pool_queue = None
+            workers = list(self._message_pool_threads)
+        if message_queue is None:
+            return
+        for _ in workers:
+            message_queue.put(_POOL_STOP)
+        current_thread = threading.current_thread()
+        for worker in workers:
+            if worker is not current_thread:
+                worker.join(timeout=timeout)
+
+    def _message_pool_worker_entry(
+        self,
+        app: EasierlitApp,
+        message_queue: queue.SimpleQueue[Any],
+    ) -> None:
+        while True:
+            incoming = message_queue.get()
+            if incoming is _POOL_STOP:
+                return
+            self._message_worker_entry(app, incoming)
+
     def _message_worker_entry(self, app: EasierlitApp, incoming: IncomingMessage) -> None:
         awaitable_runner = self._resolve_message_awaitable_runner(incoming.thread_id)
         try:
@@ -402,13 +516,76 @@ class EasierlitClient:
                 app=app,
             )
         finally:
-            with self._message_scheduler_lock:
-                self._active_message_worker_count = max(0, self._active_message_worker_count - 1)
-                self._active_chat_threads.discard(incoming.thread_id)
-                self._inflight_message_workers.discard(threading.current_thread())
-                current_app = self._app
-                if current_app is not None:
-                    self._schedule_pending_messages_locked(current_app)
+            self._release_message_slot(incoming.thread_id, worker=threading.current_thread())
+
+    def _submit_message_task(self, app: EasierlitApp, incoming: IncomingMessage) -> None:
+        # Runs inside _schedule_pending_messages_locked with the scheduler lock
+        # held, so nothing here may raise or re-enter scheduling directly.
+        awaitable_runner = self._resolve_message_awaitable_runner(incoming.thread_id)
+        coroutine = _execute_on_message_async(
+            self.on_message,
+            app,
+            incoming,
+            self._message_executor,
+        )
+        try:
+            future = awaitable_runner.submit(coroutine)
+        except Exception:
+            coroutine.close()
+            self._handle_fatal_worker_failure(
+                source="on_message",
+                traceback_text=traceback.format_exc(),
+                app=app,
+            )
+            # Fail-fast has stopped scheduling, so this release cannot recurse.
+            self._release_message_slot(incoming.thread_id)
+            return
+
+        def _on_done(done: concurrent.futures.Future[Any]) -> None:
+            # An already-finished future runs this synchronously under the
+            # scheduler lock; hop to the runner loop before releasing the slot.
+            try:
+                awaitable_runner.call_soon(self._complete_message_task, app, incoming, done)
+            except RuntimeError:
+                # Runner loop is closing; nothing is left to schedule on it.
+                self._complete_message_task(app, incoming, done)
+
+        future.add_done_callback(_on_done)
+
+    def _complete_message_task(
+        self,
+        app: EasierlitApp,
+        incoming: IncomingMessage,
+        done: concurrent.futures.Future[Any],
+    ) -> None:
+        try:
+            exc = None if done.cancelled() else done.exception()
+            if exc is not None:
+                traceback_text = "".join(
+                    traceback.format_exception(type(exc), exc, exc.__traceback__)
+                )
+                self._handle_fatal_worker_failure(
+                    source="on_message",
+                    traceback_text=traceback_text,
+                    app=app,
+                )
+        finally:
+            self._release_message_slot(incoming.thread_id)
+
+    def _release_message_slot(
+        self,
+        thread_id: str,
+        *,
+        worker: threading.Thread | None = None,
+    ) -> None:
+        with self._message_scheduler_lock:
+            self._active_message_worker_count = max(0, self._active_message_worker_count - 1)
+            self._active_chat_threads.discard(thread_id)
+            if worker is not None:
+                self._inflight_message_workers.discard(worker)
+            current_app = self._app
+            if current_app is not None:
+                self._schedule_pending_messages_locked(current_app)
 
     def _handle_fatal_worker_failure(
         self,
@@ -431,9 +608,10 @@ class EasierlitClient:
         app.close()
 
     def _summarize_traceback(self, traceback_text: str) -> str:
-        lines = [line.strip() for line in traceback_text.strip().splitlines() if line.strip()]
-        if lines:
-            return lines[-1]
+        for line in reversed(traceback_text.splitlines()):
+            stripped = line.strip()
+            if stripped:
+                return stripped
         return "Unknown worker error"
 
     def _start_awaitable_runners(self) -> None:
@@ -490,6 +668,14 @@ class EasierlitClient:
             self._active_chat_threads.add(thread_id)
             self._active_message_worker_count += 1
 
+            if self._message_pool_queue is not None:
+                self._ensure_message_pool_worker_locked(app)
+                self._message_pool_queue.put(incoming)
+                continue
+            if self.worker_mode == "asyncio":
+                self._submit_message_task(app, incoming)
+                continue
+
             worker = threading.Thread(
                 target=self._message_worker_entry,
                 args=(app, incoming),
@@ -524,12 +710,15 @@ class EasierlitClient:
 
     def _is_worker_running(self) -> bool:
         self._threads = [thread for thread in self._threads if thread.is_alive()]
+        self._message_pool_threads = [
+            worker for worker in self._message_pool_threads if worker.is_alive()
+        ]
 
         with self._message_scheduler_lock:
             self._prune_inflight_message_workers_locked()
             has_message_worker = bool(self._inflight_message_workers)
 
-        return bool(self._threads) or has_message_worker
+        return bool(self._threads) or bool(self._message_pool_threads) or has_message_worker
 
     def _prune_inflight_message_workers_locked(self) -> None:
         dead_workers = [worker for worker in self._inflight_message_workers if not worker.is_alive()]
@@ -8,23 +8,34 @@ from datetime import datetime
 from typing import Any
 from uuid import NAMESPACE_DNS, uuid5
 
+import aiohttp
 import discord
 from chainlit.data import get_data_layer
 from chainlit.user import User
 
-from .discord_outgoing import resolve_discord_channel, send_discord_command
+from .discord_outgoing import create_http_session, resolve_discord_channel, send_discord_command
 from .models import OutgoingCommand
 
 LOGGER = logging.getLogger(__name__)
 
 
 class EasierlitDiscordBridge:
-    def __init__(self, *, runtime: Any, bot_token: str) -> None:
+    def __init__(
+        self,
+        *,
+        runtime: Any,
+        bot_token: str,
+        http_pool_size: int = 32,
+        http_keepalive: float = 75.0,
+    ) -> None:
         if not isinstance(bot_token, str) or not bot_token.strip():
             raise ValueError("bot_token must be a non-empty string.")
 
         self._runtime = runtime
         self._bot_token = bot_token.strip()
+        self._http_pool_size = http_pool_size
+        self._http_keepalive = http_keepalive
+        self._http_session: aiohttp.ClientSession | None = None
 
         self._client: discord.Client | None = None
         self._client_task: asyncio.Task[None] | None = None
@@ -40,6 +51,11 @@ class EasierlitDiscordBridge:
             if self._client_task is not None and not self._client_task.done():
                 return
 
+            if self._http_session is None or self._http_session.closed:
+                self._http_session = create_http_session(
+                    pool_size=self._http_pool_size,
+                    keepalive=self._http_keepalive,
+                )
             self._client = self._create_discord_client()
             self._register_runtime_callbacks()
             self._client_task = asyncio.create_task(self._run_client_forever())
@@ -51,8 +67,16 @@ class EasierlitDiscordBridge:
 
             client = self._client
             client_task = self._client_task
+            http_session = self._http_session
             self._client = None
             self._client_task = None
+            self._http_session = None
+
+            if http_session is not None and not http_session.closed:
+                try:
+                    await http_session.close()
+                except Exception:
+                    LOGGER.exception("Failed to close Discord bridge HTTP session.")
 
             if client is not None and not client.is_closed():
                 try:
@@ -136,6 +160,7 @@ class EasierlitDiscordBridge:
             channel_id=channel_id,
             command=command,
             logger=LOGGER,
+            http_session=self._http_session,
         )
 
     async def _set_discord_typing_state(self, channel_id: int, is_running: bool) -> bool:
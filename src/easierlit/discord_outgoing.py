@@ -4,13 +4,15 @@ import asyncio
 import io
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 import aiohttp
-import discord
 from .models import OutgoingCommand
 
+if TYPE_CHECKING:
+    import discord
+
 _SUPPORTED_COMMANDS = frozenset({"add_message", "add_tool"})
 _MAX_DISCORD_ATTACHMENTS = 10
 
@@ -70,23 +72,46 @@ def _coerce_element_dict(element: Any) -> dict[str, Any]:
     return result
 
 
-async def _download_url_bytes(url: str, logger: logging.Logger) -> bytes | None:
+def create_http_session(*, pool_size: int = 32, keepalive: float = 75.0) -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=pool_size,
+        limit_per_host=min(pool_size, 8),
+        keepalive_timeout=keepalive,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+async def _download_url_bytes(
+    url: str,
+    logger: logging.Logger,
+    http_session: aiohttp.ClientSession | None = None,
+) -> bytes | None:
     parsed = urlparse(url)
     if parsed.scheme not in ("http", "https"):
         return None
 
     try:
+        if http_session is not None and not http_session.closed:
+            return await _read_url_response(http_session, url)
         async with aiohttp.ClientSession() as client:
-            async with client.get(url) as response:
-                if response.status != 200:
-                    return None
-                return await response.read()
+            return await _read_url_response(client, url)
     except Exception:
         logger.exception("Failed to download element URL for Discord attachment: %s", url)
         return None
 
 
-async def _read_element_bytes(element_dict: dict[str, Any], logger: logging.Logger) -> bytes | None:
+async def _read_url_response(client: aiohttp.ClientSession, url: str) -> bytes | None:
+    async with client.get(url) as response:
+        if response.status != 200:
+            return None
+        return await response.read()
+
+
+async def _read_element_bytes(
+    element_dict: dict[str, Any],
+    logger: logging.Logger,
+    http_session: aiohttp.ClientSession | None = None,
+) -> bytes | None:
     path_text = _coerce_text(element_dict.get("path"))
     if path_text:
         file_path = Path(path_text).expanduser()
@@ -107,7 +132,7 @@ async def _read_element_bytes(element_dict: dict[str, Any], logger: logging.Logg
 
     url = _coerce_text(element_dict.get("url"))
     if url:
-        return await _download_url_bytes(url, logger)
+        return await _download_url_bytes(url, logger, http_session)
 
     return None
 
@@ -136,14 +161,18 @@ async def build_discord_files(
     *,
     elements: list[Any],
     logger: logging.Logger,
+    http_session: aiohttp.ClientSession | None = None,
 ) -> list[discord.File]:
+    # Imported on first use so web-only deployments never load discord.py.
+    import discord
+
     files: list[discord.File] = []
     for index, element in enumerate(elements):
         if len(files) >= _MAX_DISCORD_ATTACHMENTS:
             break
 
         element_dict = _coerce_element_dict(element)
-        payload = await _read_element_bytes(element_dict, logger)
+        payload = await _read_element_bytes(element_dict, logger, http_session)
         if payload is None:
             continue
 
@@ -181,6 +210,7 @@ async def send_discord_command(
     channel_id: int,
     command: OutgoingCommand,
     logger: logging.Logger,
+    http_session: aiohttp.ClientSession | None = None,
 ) -> bool:
     if not supports_discord_command(command.command):
         return False
@@ -191,7 +221,11 @@ async def send_discord_command(
 
     try:
         raw_elements = getattr(command, "elements", None)
-        files = await build_discord_files(elements=raw_elements or [], logger=logger)
+        files = await build_discord_files(
+            elements=raw_elements or [],
+            logger=logger,
+            http_session=http_session,
+        )
         content = render_discord_content(command)
         if not content.strip() and not files:
             return False
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+import threading
+
+_UUID_POOL_SIZE = 256
+_uuid_pool = threading.local()
+
+
+def _generate_uuid4_strings(count: int) -> list[str]:
+    # One urandom read for the whole batch; version/variant bits are set by
+    # hand so the result matches str(uuid4()).
+    raw = bytearray(os.urandom(16 * count))
+    identifiers: list[str] = []
+    for offset in range(0, len(raw), 16):
+        raw[offset + 6] = (raw[offset + 6] & 0x0F) | 0x40
+        raw[offset + 8] = (raw[offset + 8] & 0x3F) | 0x80
+        hex_value = raw[offset : offset + 16].hex()
+        identifiers.append(
+            f"{hex_value[:8]}-{hex_value[8:12]}-{hex_value[12:16]}-"
+            f"{hex_value[16:20]}-{hex_value[20:]}"
+        )
+    return identifiers
+
+
+def new_uuid4_string() -> str:
+    """Return a random UUID4 string, drawn from a per-thread pre-generated batch."""
+
+    pool = getattr(_uuid_pool, "ids", None)
+    if not pool:
+        pool = _generate_uuid4_strings(_UUID_POOL_SIZE)
+        _uuid_pool.ids = pool
+    return pool.pop()
+
+
+def _reset_uuid_pool() -> None:
+    # A forked child must not reuse ids already buffered by its parent.
+    global _uuid_pool
+    _uuid_pool = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid_pool)
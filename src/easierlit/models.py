@@ -40,3 +40,7 @@ class OutgoingCommand(BaseModel):
     author: str = "Assistant"
     step_type: str | None = None
     metadata: dict[str, Any] = Field(default_factory=dict)
+
+
+# Shared shutdown signal; dispatcher loops test for it by identity.
+CLOSE_COMMAND = OutgoingCommand(command="close")
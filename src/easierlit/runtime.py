@@ -4,14 +4,13 @@ import asyncio
 import json
 import logging
 import mimetypes
-import queue
+import os
 import re
 import threading
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Coroutine
 from urllib.parse import unquote, urlparse
-from uuid import uuid4
 
 import aiohttp
 from chainlit.context import init_http_context
@@ -20,7 +19,8 @@ from chainlit.utils import utc_now
 
 from .discord_outgoing import send_discord_command, supports_discord_command
 from .errors import AppClosedError, ThreadSessionNotActiveError
-from .models import IncomingMessage, OutgoingCommand
+from .ids import new_uuid4_string
+from .models import CLOSE_COMMAND, IncomingMessage, OutgoingCommand
 from .storage.local import LOCAL_STORAGE_ROUTE_PREFIX
 
 if TYPE_CHECKING:
@@ -28,7 +28,11 @@ if TYPE_CHECKING:
 
     from .app import EasierlitApp
     from .client import EasierlitClient
-    from .settings import EasierlitAuthConfig, EasierlitPersistenceConfig
+    from .settings import (
+        EasierlitAuthConfig,
+        EasierlitDiscordConfig,
+        EasierlitPersistenceConfig,
+    )
     from .storage.local import LocalFileStorageClient
 
 LOGGER = logging.getLogger(__name__)
@@ -66,6 +70,138 @@ _DATA_LAYER_STEP_WRITERS: dict[str, str] = {
     "update_tool": "update_step",
 }
 
+# Updates replace the whole step, so an earlier update to the same message is
+# redundant once a later one is queued behind it.
+_COALESCIBLE_COMMANDS = frozenset({"update_message", "update_tool"})
+_OUTGOING_LANE_MAX_BATCH = 64
+_OUTGOING_ROUTER_MAX_BATCH = 256
+
+
+def _coalesce_outgoing_updates(commands: list[OutgoingCommand]) -> list[OutgoingCommand]:
+    if len(commands) < 2:
+        return commands
+
+    droppable: dict[str, int] = {}
+    dropped: set[int] = set()
+    for index, command in enumerate(commands):
+        message_id = command.message_id
+        if message_id is None:
+            continue
+        previous_index = droppable.pop(message_id, None)
+        if command.command not in _COALESCIBLE_COMMANDS:
+            continue
+        if previous_index is not None:
+            previous = commands[previous_index]
+            if previous.command == command.command and previous.thread_id == command.thread_id:
+                dropped.add(previous_index)
+        # Updates carrying elements have upload side effects and are kept.
+        if not command.elements:
+            droppable[message_id] = index
+
+    if not dropped:
+        return commands
+    return [command for index, command in enumerate(commands) if index not in dropped]
+
+
+def _cancel_tasks_and_stop(loop: asyncio.AbstractEventLoop) -> None:
+    for task in asyncio.all_tasks(loop):
+        task.cancel()
+    loop.stop()
+
+
+def _run_fallback_loop(loop: asyncio.AbstractEventLoop) -> None:
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        pending_tasks = asyncio.all_tasks(loop)
+        for pending_task in pending_tasks:
+            pending_task.cancel()
+        if pending_tasks:
+            loop.run_until_complete(asyncio.gather(*pending_tasks, return_exceptions=True))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+class _OutgoingWakeup:
+    """Coalescing cross-thread wakeup for the outgoing router.
+
+    Only the first `notify()` after each `clear()` signals the loop, so a burst
+    of enqueued commands costs one wakeup. On Linux the signal is an eventfd
+    watched by the loop; elsewhere it falls back to `call_soon_threadsafe`.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._event = asyncio.Event()
+        self._pending = False
+        self._fd_lock = threading.Lock()
+        self._eventfd: int | None = None
+
+        eventfd = getattr(os, "eventfd", None)
+        if eventfd is None:
+            return
+        try:
+            fd = eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+        except OSError:
+            return
+        try:
+            loop.add_reader(fd, self._on_eventfd_readable)
+        except (NotImplementedError, RuntimeError):
+            os.close(fd)
+            return
+        self._eventfd = fd
+
+    def notify(self) -> None:
+        if self._pending:
+            return
+        self._pending = True
+
+        with self._fd_lock:
+            fd = self._eventfd
+            if fd is not None:
+                try:
+                    os.eventfd_write(fd, 1)
+                except OSError:
+                    pass
+                return
+
+        try:
+            self._loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            # Loop already closed during shutdown.
+            pass
+
+    def clear(self) -> None:
+        # Reset before the router drains, so a put racing with the drain
+        # either lands in it or triggers a fresh wakeup.
+        self._event.clear()
+        self._pending = False
+
+    async def wait(self) -> None:
+        await self._event.wait()
+
+    def close(self) -> None:
+        with self._fd_lock:
+            fd = self._eventfd
+            self._eventfd = None
+        if fd is None:
+            return
+        try:
+            self._loop.remove_reader(fd)
+        except (NotImplementedError, RuntimeError):
+            pass
+        os.close(fd)
+
+    def _on_eventfd_readable(self) -> None:
+        fd = self._eventfd
+        if fd is not None:
+            try:
+                os.eventfd_read(fd)
+            except BlockingIOError:
+                pass
+        self._event.set()
+
 
 class RuntimeRegistry:
     def __init__(
@@ -80,12 +216,18 @@ class RuntimeRegistry:
         self._auth: EasierlitAuthConfig | None = None
         self._persistence: EasierlitPersistenceConfig | None = None
         self._discord_token: str | None = None
+        self._discord: EasierlitDiscordConfig | None = None
 
+        # Writers mutate the thread-keyed maps in place under `_lock`; per-command
+        # lookups are single `dict.get` calls, which are atomic under the GIL,
+        # so they read without locking.
         self._thread_to_session: dict[str, str] = {}
         self._session_to_thread: dict[str, str] = {}
         self._thread_to_discord_channel: dict[str, int] = {}
 
         self._main_loop: asyncio.AbstractEventLoop | None = None
+        self._fallback_loop: asyncio.AbstractEventLoop | None = None
+        self._fallback_loop_thread: threading.Thread | None = None
         self._dispatcher_task: asyncio.Task[None] | None = None
         self._dispatcher_lane_tasks: list[asyncio.Task[None]] = []
         self._dispatcher_lane_queues: list[asyncio.Queue[OutgoingCommand]] = []
@@ -97,7 +239,9 @@ class RuntimeRegistry:
         self._discord_sender: Callable[[int, OutgoingCommand], Awaitable[bool]] | None = None
         self._discord_typing_state_sender: Callable[[int, bool], Awaitable[bool]] | None = None
 
-        self._lock = threading.RLock()
+        # Plain Lock: every critical section only swaps fields or maps and
+        # never calls back into another locking method.
+        self._lock = threading.Lock()
 
     def bind(
         self,
@@ -108,6 +252,7 @@ class RuntimeRegistry:
         persistence: EasierlitPersistenceConfig | None = None,
         discord_token: str | None = None,
         max_outgoing_workers: int = 4,
+        discord: EasierlitDiscordConfig | None = None,
     ) -> None:
         if not isinstance(max_outgoing_workers, int) or max_outgoing_workers < 1:
             raise ValueError("max_outgoing_workers must be an integer >= 1.")
@@ -118,6 +263,7 @@ class RuntimeRegistry:
             self._auth = auth
             self._persistence = persistence
             self._discord_token = discord_token
+            self._discord = discord
             self._max_outgoing_workers = max_outgoing_workers
             self._thread_to_session.clear()
             self._session_to_thread.clear()
@@ -135,6 +281,7 @@ class RuntimeRegistry:
             self._auth = None
             self._persistence = None
             self._discord_token = None
+            self._discord = None
             self._thread_to_session.clear()
             self._session_to_thread.clear()
             self._thread_to_discord_channel.clear()
@@ -145,6 +292,20 @@ class RuntimeRegistry:
             self._max_outgoing_workers = 4
             self._discord_sender = None
             self._discord_typing_state_sender = None
+            fallback_loop = self._fallback_loop
+            fallback_loop_thread = self._fallback_loop_thread
+            self._fallback_loop = None
+            self._fallback_loop_thread = None
+
+        if fallback_loop is not None and not fallback_loop.is_closed():
+            # Cancel what is still scheduled so blocked callers are released;
+            # the loop thread drains the cancellations and closes the loop.
+            fallback_loop.call_soon_threadsafe(_cancel_tasks_and_stop, fallback_loop)
+            if (
+                fallback_loop_thread is not None
+                and fallback_loop_thread is not threading.current_thread()
+            ):
+                fallback_loop_thread.join()
 
     def get_client(self) -> EasierlitClient | None:
         return self._client
@@ -161,6 +322,9 @@ class RuntimeRegistry:
     def get_discord_token(self) -> str | None:
         return self._discord_token
 
+    def get_discord(self) -> EasierlitDiscordConfig | None:
+        return self._discord
+
     def set_discord_sender(
         self,
         sender: Callable[[int, OutgoingCommand], Awaitable[bool]] | None,
@@ -182,22 +346,75 @@ class RuntimeRegistry:
         return self._main_loop
 
     def run_coroutine_sync(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        try:
+            loop = self._resolve_sync_target_loop()
+        except RuntimeError:
+            coro.close()
+            raise
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        return future.result()
+
+    def gather_sync(self, coros: list[Coroutine[Any, Any, Any]]) -> list[Any]:
+        """Run `coros` concurrently with one cross-thread round trip.
+
+        Results are returned in input order. The first exception propagates
+        after all coroutines have finished.
+        """
+
+        if not coros:
+            return []
+
+        try:
+            loop = self._resolve_sync_target_loop()
+        except RuntimeError:
+            for coro in coros:
+                coro.close()
+            raise
+
+        async def _gather() -> list[Any]:
+            results = await asyncio.gather(*coros, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            return results
+
+        future = asyncio.run_coroutine_threadsafe(_gather(), loop)
+        return future.result()
+
+    def _resolve_sync_target_loop(self) -> asyncio.AbstractEventLoop:
         loop = self._main_loop
-        if loop and loop.is_running():
-            try:
-                running_loop = asyncio.get_running_loop()
-            except RuntimeError:
-                running_loop = None
+        if loop is None or not loop.is_running():
+            # No Chainlit loop yet (e.g. scripts or tests): reuse one background
+            # loop instead of building and tearing down a loop per call.
+            loop = self._get_fallback_loop()
 
-            if running_loop is loop:
-                raise RuntimeError(
-                    "Cannot synchronously wait for a coroutine from the Chainlit event loop."
-                )
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
 
-            future = asyncio.run_coroutine_threadsafe(coro, loop)
-            return future.result()
+        if running_loop is loop:
+            raise RuntimeError(
+                "Cannot synchronously wait for a coroutine from the Chainlit event loop."
+            )
+        return loop
 
-        return asyncio.run(coro)
+    def _get_fallback_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            loop = self._fallback_loop
+            if loop is None or loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=_run_fallback_loop,
+                    args=(loop,),
+                    name="easierlit-runtime-loop",
+                    daemon=True,
+                )
+                thread.start()
+                self._fallback_loop = loop
+                self._fallback_loop_thread = thread
+            return loop
 
     def register_session(self, thread_id: str, session_id: str) -> None:
         with self._lock:
@@ -215,12 +432,10 @@ class RuntimeRegistry:
                 self._thread_to_session.pop(thread_id, None)
 
     def get_session_id_for_thread(self, thread_id: str) -> str | None:
-        with self._lock:
-            return self._thread_to_session.get(thread_id)
+        return self._thread_to_session.get(thread_id)
 
     def get_discord_channel_for_thread(self, thread_id: str) -> int | None:
-        with self._lock:
-            return self._thread_to_discord_channel.get(thread_id)
+        return self._thread_to_discord_channel.get(thread_id)
 
     def is_discord_thread(self, thread_id: str) -> bool:
         if not isinstance(thread_id, str):
@@ -312,45 +527,59 @@ class RuntimeRegistry:
         if app is None:
             return
 
-        while not app.is_closed():
-            try:
-                command = await asyncio.to_thread(app._pop_outgoing, 0.2)
-            except queue.Empty:
-                continue
-
-            if command.command == "close":
-                await self._broadcast_dispatcher_close_signal()
-                break
-
-            lane_queue = self._resolve_outgoing_lane_queue(command)
-            if lane_queue is None:
-                continue
-            await lane_queue.put(command)
+        wakeup = _OutgoingWakeup(asyncio.get_running_loop())
+        # Producers wake the router directly instead of the router polling the
+        # queue from a worker thread.
+        app._set_outgoing_notifier(wakeup.notify)
+        try:
+            while True:
+                wakeup.clear()
+                while commands := app._pop_outgoing_batch(_OUTGOING_ROUTER_MAX_BATCH):
+                    for command in commands:
+                        if command is CLOSE_COMMAND:
+                            await self._broadcast_dispatcher_close_signal()
+                            return
+
+                        lane_queue = self._resolve_outgoing_lane_queue(command)
+                        if lane_queue is None:
+                            continue
+                        await lane_queue.put(command)
+
+                await wakeup.wait()
+        finally:
+            app._set_outgoing_notifier(None)
+            wakeup.close()
 
     async def _dispatch_outgoing_lane_loop(
         self,
         lane_queue: asyncio.Queue[OutgoingCommand],
     ) -> None:
         while True:
-            command = await lane_queue.get()
-            if command.command == "close":
-                return
-
-            try:
-                await self.apply_outgoing_command(command)
-            except Exception:
-                LOGGER.exception(
-                    "Failed to apply outgoing command: %s",
-                    command.model_dump(),
-                )
+            batch = [await lane_queue.get()]
+            while len(batch) < _OUTGOING_LANE_MAX_BATCH:
+                try:
+                    batch.append(lane_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            for command in _coalesce_outgoing_updates(batch):
+                if command is CLOSE_COMMAND:
+                    return
+
+                try:
+                    await self.apply_outgoing_command(command)
+                except Exception:
+                    LOGGER.exception(
+                        "Failed to apply outgoing command: %s",
+                        command.model_dump(),
+                    )
 
     async def _broadcast_dispatcher_close_signal(self) -> None:
         if not self._dispatcher_lane_queues:
             return
 
-        close_command = OutgoingCommand(command="close")
         for lane_queue in self._dispatcher_lane_queues:
-            await lane_queue.put(close_command)
+            await lane_queue.put(CLOSE_COMMAND)
 
     def _resolve_outgoing_lane_queue(
         self,
@@ -714,7 +943,7 @@ class RuntimeRegistry:
             )
 
         element_dict = self._coerce_element_dict(element)
-        element_id = self._coerce_text(element_dict.get("id")) or str(uuid4())
+        element_id = self._coerce_text(element_dict.get("id")) or new_uuid4_string()
         element_name = self._coerce_text(element_dict.get("name")) or f"element-{index + 1}"
         mime = self._coerce_text(element_dict.get("mime")) or self._guess_mime_type(element_name)
         element_type = self._coerce_text(element_dict.get("type")) or self._infer_element_type_from_mime(
@@ -886,7 +1115,7 @@ class RuntimeRegistry:
         if not isinstance(element, dict):
             return None
 
-        element_id = self._coerce_text(element.get("id")) or str(uuid4())
+        element_id = self._coerce_text(element.get("id")) or new_uuid4_string()
 
         normalized = dict(element)
         normalized["id"] = element_id
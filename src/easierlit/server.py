@@ -152,6 +152,7 @@ class EasierlitServer:
             persistence=self.persistence,
             discord_token=resolved_discord_token,
             max_outgoing_workers=self.max_outgoing_workers,
+            discord=self.discord,
         )
 
         def _handle_worker_crash(traceback_text: str) -> None:
@@ -13,6 +13,9 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+_SQLITE_JOURNAL_MODES = frozenset({"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"})
+_SQLITE_SYNCHRONOUS_MODES = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+
 
 def _build_local_storage_provider(base_dir: str | Path | None) -> LocalFileStorageClient:
     return ensure_local_storage_provider(LocalFileStorageClient(base_dir=base_dir))
@@ -107,6 +110,18 @@ class EasierlitPersistenceConfig:
         sqlite_path: SQLite database file path used by runtime bootstrap.
         local_storage_dir: Optional local file root override for
             `LocalFileStorageClient`.
+        journal_mode: SQLite `PRAGMA journal_mode` applied on every new
+            connection. `WAL` lets thread-history reads proceed while
+            message writes commit.
+        synchronous: SQLite `PRAGMA synchronous` applied on every new
+            connection. `NORMAL` is durable under WAL with one fsync per
+            checkpoint instead of per commit.
+        busy_timeout_ms: SQLite `PRAGMA busy_timeout` in milliseconds. Writers
+            wait this long on a locked database before failing.
+        pool_size: Number of pooled SQLite connections kept by the default
+            data layer. Under WAL, reads on separate connections run
+            concurrently with the single writer. Up to 10 overflow
+            connections are opened on top of this during bursts.
 
     Notes:
         When `enabled=True`, a `LocalFileStorageClient` is created
@@ -116,6 +131,10 @@ class EasierlitPersistenceConfig:
     enabled: bool = True
     sqlite_path: str = ".chainlit/easierlit.db"
     local_storage_dir: str | Path | None = None
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5000
+    pool_size: int = 8
     _storage_provider: LocalFileStorageClient | None = field(
         init=False,
         default=None,
@@ -123,6 +142,29 @@ class EasierlitPersistenceConfig:
     )
 
     def __post_init__(self) -> None:
+        journal_mode = str(self.journal_mode).strip().upper()
+        if journal_mode not in _SQLITE_JOURNAL_MODES:
+            raise ValueError(
+                "EasierlitPersistenceConfig.journal_mode must be one of "
+                f"{sorted(_SQLITE_JOURNAL_MODES)}."
+            )
+        synchronous = str(self.synchronous).strip().upper()
+        if synchronous not in _SQLITE_SYNCHRONOUS_MODES:
+            raise ValueError(
+                "EasierlitPersistenceConfig.synchronous must be one of "
+                f"{sorted(_SQLITE_SYNCHRONOUS_MODES)}."
+            )
+        if (
+            isinstance(self.busy_timeout_ms, bool)
+            or not isinstance(self.busy_timeout_ms, int)
+            or self.busy_timeout_ms < 0
+        ):
+            raise ValueError("EasierlitPersistenceConfig.busy_timeout_ms must be a non-negative int.")
+        if isinstance(self.pool_size, bool) or not isinstance(self.pool_size, int) or self.pool_size < 1:
+            raise ValueError("EasierlitPersistenceConfig.pool_size must be a positive int.")
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+
         if not self.enabled:
             return
         self._storage_provider = _build_local_storage_provider(self.local_storage_dir)
@@ -149,11 +191,24 @@ class EasierlitDiscordConfig:
         enabled: Enable/disable Easierlit Discord bridge.
         bot_token: Optional explicit bot token. When omitted, runtime falls back
             to `DISCORD_BOT_TOKEN` environment variable.
+        pool_size: Connection limit of the bridge's shared aiohttp session used
+            to download URL elements for Discord attachments.
+        keepalive: Idle keep-alive seconds for pooled connections.
     """
 
     enabled: bool = True
     bot_token: str | None = None
+    pool_size: int = 32
+    keepalive: float = 75.0
 
     def __post_init__(self) -> None:
         if self.bot_token is not None and not self.bot_token.strip():
             raise ValueError("EasierlitDiscordConfig.bot_token must not be empty.")
+        if isinstance(self.pool_size, bool) or not isinstance(self.pool_size, int) or self.pool_size < 1:
+            raise ValueError("EasierlitDiscordConfig.pool_size must be an integer >= 1.")
+        if (
+            isinstance(self.keepalive, bool)
+            or not isinstance(self.keepalive, (int, float))
+            or self.keepalive < 0
+        ):
+            raise ValueError("EasierlitDiscordConfig.keepalive must be a non-negative number.")
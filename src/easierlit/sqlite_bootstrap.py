@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import sqlite3
 from pathlib import Path
+from typing import Any
 
 LOGGER = logging.getLogger(__name__)
 
@@ -200,3 +201,53 @@ def ensure_sqlite_schema(sqlite_path: str | Path) -> Path:
         connection.close()
 
     return path
+
+
+def build_sqlite_pragmas(
+    *,
+    journal_mode: str = "WAL",
+    synchronous: str = "NORMAL",
+    busy_timeout_ms: int = 5000,
+) -> tuple[str, ...]:
+    return (
+        f"PRAGMA journal_mode={journal_mode}",
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA busy_timeout={int(busy_timeout_ms)}",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-20000",
+        "PRAGMA mmap_size=268435456",
+    )
+
+
+def install_sqlite_pragmas(engine: Any, pragmas: tuple[str, ...]) -> bool:
+    """Run `pragmas` on every new DBAPI connection of a SQLite `engine`.
+
+    Returns False without installing anything for non-SQLite engines. The
+    journal mode pragma is skipped for in-memory databases, which cannot use WAL.
+    """
+
+    url = getattr(engine, "url", None)
+    drivername = getattr(url, "drivername", "")
+    if not isinstance(drivername, str) or not drivername.startswith("sqlite"):
+        return False
+
+    database = getattr(url, "database", None)
+    if not database or database == ":memory:" or "mode=memory" in str(url):
+        pragmas = tuple(
+            pragma for pragma in pragmas if not pragma.startswith("PRAGMA journal_mode=")
+        )
+
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return True
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import queue
+import uuid
+
+import pytest
+
+from easierlit.app import EasierlitApp
+from easierlit.errors import AppClosedError
+
+
+def _drain(app: EasierlitApp) -> list:
+    commands = []
+    while True:
+        try:
+            commands.append(app._pop_outgoing(timeout=0))
+        except queue.Empty:
+            return commands
+
+
+def test_outgoing_commands_are_popped_in_fifo_order():
+    app = EasierlitApp(runtime=object())
+
+    message_id = app.add_message("thread-1", "first")
+    app.update_message("thread-1", message_id, "second")
+    app.delete_message("thread-1", message_id)
+
+    commands = _drain(app)
+    assert [command.command for command in commands] == [
+        "add_message",
+        "update_message",
+        "delete",
+    ]
+    assert [command.content for command in commands[:2]] == ["first", "second"]
+
+
+def test_batch_flushes_on_exit_and_discards_on_error():
+    app = EasierlitApp(runtime=object())
+
+    with app.batch():
+        app.add_message("thread-1", "a")
+        app.add_message("thread-1", "b")
+        assert _drain(app) == []
+    assert [command.content for command in _drain(app)] == ["a", "b"]
+
+    with pytest.raises(KeyError):
+        with app.batch():
+            app.add_message("thread-1", "dropped")
+            raise KeyError("boom")
+    assert _drain(app) == []
+
+
+def test_close_rejects_new_commands():
+    app = EasierlitApp(runtime=object())
+    app.close()
+
+    assert [command.command for command in _drain(app)] == ["close"]
+    with pytest.raises(AppClosedError):
+        app.add_message("thread-1", "late")
+
+
+def test_default_message_ids_are_unique_uuid4_strings():
+    app = EasierlitApp(runtime=object())
+
+    message_ids = [app.add_message("thread-1", "x") for _ in range(600)]
+
+    assert len(set(message_ids)) == len(message_ids)
+    for message_id in message_ids:
+        parsed = uuid.UUID(message_id)
+        assert parsed.version == 4
+        assert str(parsed) == message_id
+
+
+def test_open_stream_pushes_updates_for_the_bound_message():
+    app = EasierlitApp(runtime=object())
+    message_id = app.add_message("thread-1", "")
+    _drain(app)
+
+    stream = app.open_stream("thread-1", message_id, metadata={"phase": "stream"})
+    stream.push("He")
+    stream.push("Hello")
+
+    commands = _drain(app)
+    assert [command.command for command in commands] == ["update_message", "update_message"]
+    assert [command.content for command in commands] == ["He", "Hello"]
+    assert {command.message_id for command in commands} == {message_id}
+    assert all(command.metadata == {"phase": "stream"} for command in commands)
+
+    with pytest.raises(ValueError):
+        app.open_stream("thread-1", " ")
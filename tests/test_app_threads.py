@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from easierlit.app import EasierlitApp
+from easierlit.runtime import RuntimeRegistry
+
+
+class _FakeDataLayer:
+    def __init__(self, threads: dict[str, dict]) -> None:
+        self.threads = threads
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_thread(self, thread_id: str):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.threads.get(thread_id)
+
+
+def _make_app(data_layer: _FakeDataLayer) -> EasierlitApp:
+    runtime = RuntimeRegistry(data_layer_getter=lambda: data_layer)
+    return EasierlitApp(runtime=runtime, data_layer_getter=lambda: data_layer)
+
+
+def test_get_threads_loads_concurrently_in_input_order():
+    data_layer = _FakeDataLayer(
+        {
+            "thread-a": {"id": "thread-a", "tags": None},
+            "thread-b": {"id": "thread-b", "tags": None},
+            "thread-c": {"id": "thread-c", "tags": None},
+        }
+    )
+    app = _make_app(data_layer)
+
+    threads = app.get_threads(["thread-c", "thread-a", "thread-b"])
+
+    assert [thread["id"] for thread in threads] == ["thread-c", "thread-a", "thread-b"]
+    assert data_layer.max_in_flight == 3
+
+
+def test_get_threads_raises_for_missing_thread():
+    app = _make_app(_FakeDataLayer({"thread-a": {"id": "thread-a"}}))
+
+    with pytest.raises(ValueError, match="thread-missing"):
+        app.get_threads(["thread-a", "thread-missing"])
+
+
+def test_thread_step_deletes_run_one_at_a_time_in_order():
+    runtime = RuntimeRegistry()
+    app = EasierlitApp(runtime=runtime)
+    deleted: list[str] = []
+    in_flight = 0
+
+    async def _record(command) -> None:
+        nonlocal in_flight
+        in_flight += 1
+        assert in_flight == 1
+        await asyncio.sleep(0.001)
+        deleted.append(command.message_id)
+        in_flight -= 1
+
+    runtime.apply_outgoing_command = _record
+
+    app._delete_thread_steps_immediately(thread_id="thread-1", step_ids=["s1", "s2", "s3"])
+
+    assert deleted == ["s1", "s2", "s3"]
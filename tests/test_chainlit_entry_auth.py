@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import asyncio
+
+from easierlit.settings import EasierlitAuthConfig
+
+
+def test_password_auth_callback_accepts_non_ascii_credentials(monkeypatch):
+    import easierlit.chainlit_entry as module
+
+    registered = []
+    monkeypatch.setattr(
+        module.RUNTIME,
+        "get_auth",
+        lambda: EasierlitAuthConfig(username="관리자", password="pässword"),
+    )
+    monkeypatch.setattr(module.cl, "password_auth_callback", registered.append)
+
+    module._apply_auth_configuration()
+    (callback,) = registered
+
+    user = asyncio.run(callback("관리자", "pässword"))
+    assert user is not None
+    assert user.identifier == "관리자"
+    assert asyncio.run(callback("관리자", "wrong")) is None
+    assert asyncio.run(callback("admin", "pässword")) is None
@@ -25,6 +25,7 @@ def test_suppress_and_restore_chainlit_discord_autostart(monkeypatch):
 
     fake_client = _FakeChainlitDiscordClient()
     monkeypatch.setattr(module, "_resolve_chainlit_discord_client", lambda: fake_client)
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "token-env")
     _reset_discord_autostart_state(module)
 
     module._suppress_chainlit_discord_autostart()
@@ -48,6 +49,7 @@ def test_suppress_restore_are_idempotent(monkeypatch):
 
     fake_client = _FakeChainlitDiscordClient()
     monkeypatch.setattr(module, "_resolve_chainlit_discord_client", lambda: fake_client)
+    monkeypatch.setenv("DISCORD_BOT_TOKEN", "token-env")
     _reset_discord_autostart_state(module)
 
     module._suppress_chainlit_discord_autostart()
@@ -65,6 +67,24 @@ def test_suppress_restore_are_idempotent(monkeypatch):
     assert module._CHAINLIT_DISCORD_AUTOSTART_SUPPRESSED is False
 
 
+def test_suppress_skips_chainlit_discord_import_without_token(monkeypatch):
+    import easierlit.chainlit_entry as module
+
+    resolve_calls: list[str] = []
+
+    def _record_resolve():
+        resolve_calls.append("resolve")
+        return _FakeChainlitDiscordClient()
+
+    monkeypatch.setattr(module, "_resolve_chainlit_discord_client", _record_resolve)
+    monkeypatch.delenv("DISCORD_BOT_TOKEN", raising=False)
+    _reset_discord_autostart_state(module)
+
+    module._suppress_chainlit_discord_autostart()
+    assert resolve_calls == []
+    assert module._CHAINLIT_DISCORD_AUTOSTART_SUPPRESSED is False
+
+
 def test_on_app_startup_suppresses_before_bridge_start(monkeypatch):
     import easierlit.chainlit_entry as module
 
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import contextvars
+import threading
+
+import pytest
+
+from easierlit.app import EasierlitApp
+from easierlit.client import EasierlitClient
+from easierlit.errors import RunFuncExecutionError
+from easierlit.models import IncomingMessage
+
+
+def _incoming(thread_id: str, index: int) -> IncomingMessage:
+    return IncomingMessage(
+        thread_id=thread_id,
+        session_id="session",
+        message_id=f"{thread_id}-{index}",
+        content=str(index),
+        author="User",
+    )
+
+
+@pytest.mark.parametrize("worker_mode", ["pool", "asyncio"])
+def test_worker_mode_preserves_per_thread_order(worker_mode):
+    seen: dict[str, list[int]] = {}
+    seen_lock = threading.Lock()
+    done = threading.Event()
+    total = 60
+
+    def on_message(app, incoming):
+        with seen_lock:
+            seen.setdefault(incoming.thread_id, []).append(int(incoming.content))
+            if sum(len(values) for values in seen.values()) == total:
+                done.set()
+
+    client = EasierlitClient(on_message=on_message, worker_mode=worker_mode, max_message_workers=3)
+    client.run(EasierlitApp(runtime=object()))
+    try:
+        for index in range(total):
+            client.dispatch_incoming(_incoming(f"thread-{index % 5}", index))
+        assert done.wait(timeout=5.0)
+    finally:
+        client.stop()
+
+    assert len(seen) == 5
+    for values in seen.values():
+        assert values == sorted(values)
+
+
+def test_run_awaitable_propagates_runtime_error_from_running_runner():
+    from easierlit.client import AsyncAwaitableRunner, _run_awaitable
+
+    runner = AsyncAwaitableRunner()
+    runner.start()
+
+    async def _boom():
+        raise RuntimeError("user failure")
+
+    try:
+        with pytest.raises(RuntimeError, match="user failure"):
+            _run_awaitable(_boom(), runner)
+    finally:
+        runner.stop()
+
+
+def test_asyncio_mode_sync_handler_sees_dispatcher_context():
+    request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
+    seen: list[str] = []
+    done = threading.Event()
+
+    def on_message(app, incoming):
+        seen.append(request_id.get())
+        done.set()
+
+    client = EasierlitClient(on_message=on_message, worker_mode="asyncio")
+    client.run(EasierlitApp(runtime=object()))
+    try:
+        token = request_id.set("req-1")
+        try:
+            client.dispatch_incoming(_incoming("thread-1", 0))
+        finally:
+            request_id.reset(token)
+        assert done.wait(timeout=5.0)
+    finally:
+        client.stop()
+
+    assert seen == ["req-1"]
+
+
+def test_asyncio_mode_submit_failure_fails_fast_without_raising(recwarn):
+    async def on_message(app, incoming):
+        return None
+
+    client = EasierlitClient(on_message=on_message, worker_mode="asyncio", max_message_workers=2)
+    app = EasierlitApp(runtime=object())
+    client.run(app)
+
+    def _refuse(awaitable):
+        raise RuntimeError("runner refused task")
+
+    for runner in client._message_awaitable_runners:
+        runner.submit = _refuse
+
+    client.dispatch_incoming(_incoming("thread-1", 0))
+
+    assert "runner refused task" in (client.peek_worker_error() or "")
+    assert app.is_closed()
+    assert client._active_message_worker_count == 0
+    with pytest.raises(RunFuncExecutionError):
+        client.stop()
+    assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+
+
+def test_pool_mode_starts_workers_on_demand_and_joins_them_on_stop():
+    finished = threading.Event()
+    started = threading.Event()
+
+    def on_message(app, incoming):
+        started.set()
+        finished.wait(timeout=0.2)
+        finished.set()
+
+    client = EasierlitClient(on_message=on_message, worker_mode="pool", max_message_workers=64)
+    client.run(EasierlitApp(runtime=object()))
+    assert client._message_pool_threads == []
+
+    client.dispatch_incoming(_incoming("thread-1", 0))
+    assert started.wait(timeout=5.0)
+    assert len(client._message_pool_threads) == 1
+    workers = list(client._message_pool_threads)
+
+    client.stop()
+
+    assert finished.is_set()
+    assert not any(worker.is_alive() for worker in workers)
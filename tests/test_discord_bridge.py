@@ -454,10 +454,11 @@ def test_sender_callback_uses_send_discord_command(monkeypatch):
 
         captured: dict[str, object] = {}
 
-        async def _fake_send_discord_command(*, client, channel_id, command, logger):
+        async def _fake_send_discord_command(*, client, channel_id, command, logger, http_session):
             captured["client"] = client
             captured["channel_id"] = channel_id
             captured["command"] = command
+            captured["http_session"] = http_session
             return True
 
         monkeypatch.setattr(module, "send_discord_command", _fake_send_discord_command)
@@ -472,8 +473,12 @@ def test_sender_callback_uses_send_discord_command(monkeypatch):
         assert result is True
         assert captured["client"] is fake_client
         assert captured["channel_id"] == 321
+        shared_session = captured["http_session"]
+        assert shared_session is not None
+        assert not shared_session.closed
 
         await bridge.stop()
+        assert shared_session.closed
 
     asyncio.run(_scenario())
 
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from easierlit.app import EasierlitApp
+from easierlit.models import CLOSE_COMMAND, OutgoingCommand
+from easierlit.runtime import RuntimeRegistry
+
+
+def _command(command: str, message_id: str, content: str = "", **kwargs) -> OutgoingCommand:
+    return OutgoingCommand(
+        command=command,
+        thread_id="thread-1",
+        message_id=message_id,
+        content=content,
+        **kwargs,
+    )
+
+
+def test_lane_coalesces_queued_updates_to_the_same_message():
+    runtime = RuntimeRegistry()
+    applied: list[tuple[str, str | None, str | None]] = []
+
+    async def _record(command: OutgoingCommand) -> None:
+        applied.append((command.command, command.message_id, command.content))
+
+    runtime.apply_outgoing_command = _record
+
+    async def _run() -> None:
+        lane_queue: asyncio.Queue[OutgoingCommand] = asyncio.Queue()
+        for command in (
+            _command("add_message", "m1", "a"),
+            _command("update_message", "m1", "ab"),
+            _command("update_message", "m2", "x"),
+            _command("update_message", "m1", "abc"),
+            _command("update_message", "m1", "abcd", elements=[{"name": "f"}]),
+            _command("update_message", "m1", "abcde"),
+            _command("delete", "m2"),
+            CLOSE_COMMAND,
+        ):
+            lane_queue.put_nowait(command)
+        await runtime._dispatch_outgoing_lane_loop(lane_queue)
+
+    asyncio.run(_run())
+
+    assert applied == [
+        ("add_message", "m1", "a"),
+        ("update_message", "m2", "x"),
+        ("update_message", "m1", "abcd"),
+        ("update_message", "m1", "abcde"),
+        ("delete", "m2", ""),
+    ]
+
+
+@pytest.mark.parametrize("use_eventfd", [True, False])
+def test_router_wakes_for_commands_from_other_threads(monkeypatch, use_eventfd):
+    if not use_eventfd:
+        monkeypatch.delattr(os, "eventfd", raising=False)
+    runtime = RuntimeRegistry()
+    app = EasierlitApp(runtime=runtime)
+    runtime._app = app
+    routed: list[str | None] = []
+
+    def _route(command: OutgoingCommand):
+        routed.append(command.content)
+        return None
+
+    async def _closed() -> None:
+        routed.append("closed")
+
+    runtime._resolve_outgoing_lane_queue = _route
+    runtime._broadcast_dispatcher_close_signal = _closed
+
+    async def _run() -> None:
+        router = asyncio.create_task(runtime._dispatch_outgoing_router_loop())
+        await asyncio.sleep(0.05)
+
+        def _produce() -> None:
+            for index in range(50):
+                app.add_message("thread-1", str(index))
+            app.close()
+
+        producer = threading.Thread(target=_produce)
+        producer.start()
+        await asyncio.wait_for(router, timeout=5.0)
+        producer.join()
+
+    asyncio.run(_run())
+
+    assert routed == [str(index) for index in range(50)] + ["closed"]
+
+
+def test_unbind_stops_and_closes_the_fallback_loop():
+    runtime = RuntimeRegistry()
+
+    async def _answer() -> int:
+        return 42
+
+    assert runtime.run_coroutine_sync(_answer()) == 42
+    loop = runtime._fallback_loop
+    thread = runtime._fallback_loop_thread
+
+    runtime.unbind()
+
+    assert loop.is_closed()
+    assert not thread.is_alive()
+    assert runtime._fallback_loop is None
+
+
+def test_gather_sync_on_target_loop_closes_every_coroutine():
+    runtime = RuntimeRegistry()
+
+    async def _noop() -> None:
+        return None
+
+    async def _run() -> list:
+        runtime.set_main_loop(asyncio.get_running_loop())
+        coros = [_noop(), _noop()]
+        with pytest.raises(RuntimeError):
+            runtime.gather_sync(coros)
+        return coros
+
+    coros = asyncio.run(_run())
+    assert all(coro.cr_frame is None for coro in coros)
+
+
+def test_unbind_cancels_pending_fallback_work():
+    runtime = RuntimeRegistry()
+    started = threading.Event()
+    outcome: list[str] = []
+
+    async def _block() -> None:
+        started.set()
+        await asyncio.sleep(60)
+
+    def _caller() -> None:
+        try:
+            runtime.run_coroutine_sync(_block())
+        except BaseException as exc:
+            outcome.append(type(exc).__name__)
+
+    caller = threading.Thread(target=_caller)
+    caller.start()
+    assert started.wait(timeout=5.0)
+    loop = runtime._fallback_loop
+
+    runtime.unbind()
+    caller.join(timeout=5.0)
+
+    assert outcome == ["CancelledError"]
+    assert loop.is_closed()
+
+
+def test_unbind_from_the_fallback_loop_thread_still_closes_it():
+    runtime = RuntimeRegistry()
+
+    async def _unbind_here() -> None:
+        runtime.unbind()
+
+    loop = runtime._get_fallback_loop()
+    thread = runtime._fallback_loop_thread
+    asyncio.run_coroutine_threadsafe(_unbind_here(), loop).result(timeout=5.0)
+    thread.join(timeout=5.0)
+
+    assert loop.is_closed()